@@ -0,0 +1,74 @@
+"""
+Measures how long `import diseaseapi` takes and checks that it does not pull in aiohttp
+or the API wrappers until they are used.
+
+Usage: python benchmarks/import_time.py [--runs N] [--max-ms MS]
+Exits with a non-zero status if the import is no longer lazy or is slower than --max-ms.
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+HEAVY = ('aiohttp', 'diseaseapi.covid', 'diseaseapi.influenza', 'diseaseapi.request')
+
+PROBE = """
+import sys, time
+start = time.perf_counter()
+import diseaseapi
+elapsed = time.perf_counter() - start
+diseaseapi.format_number(1000)
+print(elapsed)
+print(','.join(m for m in {heavy!r} if m in sys.modules))
+"""
+
+FULL = """
+import time
+start = time.perf_counter()
+import diseaseapi
+diseaseapi.Client
+print(time.perf_counter() - start)
+"""
+
+
+def run(code):
+    out = subprocess.check_output([sys.executable, '-c', code], cwd=ROOT, universal_newlines=True)
+    return out.splitlines()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--runs', type=int, default=10)
+    parser.add_argument('--max-ms', type=float, default=None)
+    args = parser.parse_args()
+
+    light = []
+    loaded = set()
+    for _ in range(args.runs):
+        elapsed, modules = (run(PROBE.format(heavy=HEAVY)) + [''])[:2]
+        light.append(float(elapsed) * 1000)
+        loaded.update(m for m in modules.split(',') if m)
+
+    full = [float(run(FULL)[0]) * 1000 for _ in range(args.runs)]
+
+    print('import diseaseapi:          median {:.2f} ms'.format(statistics.median(light)))
+    print('import diseaseapi + Client: median {:.2f} ms'.format(statistics.median(full)))
+
+    failed = False
+
+    if loaded:
+        print('FAIL: eagerly imported {}'.format(', '.join(sorted(loaded))))
+        failed = True
+
+    if args.max_ms is not None and statistics.median(light) > args.max_ms:
+        print('FAIL: import took longer than {} ms'.format(args.max_ms))
+        failed = True
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,250 @@
+"""
+Load test for the request layer against a local stub of the disease.sh API.
+
+Starts an aiohttp server in a separate process which emulates the disease.sh routes with
+tunable payload sizes and latency, then calls a `Client` method at a fixed concurrency
+and reports throughput, latency percentiles, connection pool saturation and queueing
+and peak RSS of the client process.
+
+Usage: python benchmarks/loadtest.py [--method country] [--args UK] [--requests 5000]
+                                     [--concurrency 1000] [--rows 200] [--latency 20] [--jitter 10]
+                                     [--connector-limit 100]
+"""
+import argparse
+import asyncio
+import multiprocessing
+import os
+import random
+import resource
+import socket
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import aiohttp
+from aiohttp import web
+
+import diseaseapi
+
+UPDATED = int(time.time() * 1000)
+
+
+def country(i):
+    return {
+        "updated": UPDATED, "country": "Country {}".format(i), "continent": "Europe", "population": 1000000,
+        "countryInfo": {"_id": i, "iso2": "C{}".format(i), "iso3": "CC{}".format(i), "lat": 0, "long": 0, "flag": ""},
+        "cases": i, "todayCases": 0, "deaths": 0, "todayDeaths": 0, "recovered": 0, "todayRecovered": 0,
+        "active": 0, "critical": 0, "tests": 0
+    }
+
+
+def timeline(days):
+    dates = ['{}/{}/20'.format(1 + d // 28 % 12, 1 + d % 28) for d in range(days)]
+    return {key: {date: i for i, date in enumerate(dates)} for key in ('cases', 'deaths', 'recovered')}
+
+
+def jhu(i):
+    return {
+        "country": "US", "province": "State {}".format(i % 50), "county": "County {}".format(i),
+        "updatedAt": "2020-01-01 00:00:00", "stats": {"confirmed": i, "deaths": 0, "recovered": 0},
+        "coordinates": {"latitude": "40.0", "longitude": "-80.0"}
+    }
+
+
+def build_app(rows, latency, jitter):
+    payloads = {
+        'all': dict(country(0), affectedCountries=rows),
+        'countries': [country(i) for i in range(rows)],
+        'states': [{"state": "State {}".format(i), "cases": i} for i in range(rows)],
+        'history': {"country": "Country", "province": None, "timeline": timeline(rows)},
+        'jhu': [jhu(i) for i in range(rows)],
+        'nyt': [{"date": "2020-03-01", "county": "County {}".format(i), "state": "State", "fips": str(i), "cases": i, "deaths": 0}
+                for i in range(rows)],
+        'coverage': [{"country": "Country {}".format(i), "timeline": timeline(30)['cases']} for i in range(rows)],
+    }
+
+    def route(name, single=False):
+        async def handler(request):
+            delay = max(latency + random.uniform(-jitter, jitter), 0) / 1000.0
+            if delay:
+                await asyncio.sleep(delay)
+            payload = payloads[name]
+            if single:
+                payload = payload[0]
+            return web.json_response(payload)
+        return handler
+
+    app = web.Application()
+    app.add_routes([
+        web.get('/v3/covid-19/all', route('all')),
+        web.get('/v3/covid-19/countries', route('countries')),
+        web.get('/v3/covid-19/countries/{country}', route('countries', True)),
+        web.get('/v3/covid-19/continents', route('countries')),
+        web.get('/v3/covid-19/states', route('states')),
+        web.get('/v3/covid-19/states/{state}', route('states', True)),
+        web.get('/v3/covid-19/historical/{country}', route('history')),
+        web.get('/v3/covid-19/jhucsse', route('jhu')),
+        web.get('/v3/covid-19/jhucsse/counties', route('jhu')),
+        web.get('/v3/covid-19/nyt/counties', route('nyt')),
+        web.get('/v3/covid-19/vaccine/coverage/countries', route('coverage')),
+    ])
+    return app
+
+
+def serve(port, rows, latency, jitter):
+    web.run_app(build_app(rows, latency, jitter), host='127.0.0.1', port=port, print=None, access_log=None)
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+
+def percentile(values, p):
+    return values[min(int(len(values) * p), len(values) - 1)]
+
+
+def peak_rss_mb():
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss / 1024.0 if sys.platform != 'darwin' else rss / (1024.0 * 1024.0)
+
+
+class PoolStats:
+    """
+    Connection pool usage collected through aiohttp's tracing hooks: connections checked out of the pool,
+    requests queued waiting for a free connection and how long they waited.
+    """
+    def __init__(self):
+        self.connector = None
+        self.queued = 0
+        self.peak_queued = 0
+        self.peak_in_use = 0
+        self.created = 0
+        self.waits = []
+
+    def trace_config(self):
+        trace = aiohttp.TraceConfig()
+        trace.on_connection_queued_start.append(self._queued_start)
+        trace.on_connection_queued_end.append(self._queued_end)
+        trace.on_connection_create_end.append(self._created)
+        trace.on_connection_reuseconn.append(self._acquired)
+        return trace
+
+    def _sample(self):
+        # the connector's set of checked out connections, which only grows at these hooks
+        self.peak_in_use = max(self.peak_in_use, len(self.connector._acquired))
+
+    async def _queued_start(self, session, ctx, params):
+        ctx.queued_at = time.perf_counter()
+        self.queued += 1
+        self.peak_queued = max(self.peak_queued, self.queued)
+
+    async def _queued_end(self, session, ctx, params):
+        self.queued -= 1
+        self.waits.append(time.perf_counter() - ctx.queued_at)
+
+    async def _created(self, session, ctx, params):
+        self.created += 1
+        self._sample()
+
+    async def _acquired(self, session, ctx, params):
+        self._sample()
+
+
+async def drive(args, base_url):
+    client = diseaseapi.Client(base_url)
+    pool = PoolStats()
+    request_client = client.request_client
+    headers = request_client.session.headers
+    await request_client.session.close()
+    pool.connector = aiohttp.TCPConnector(limit=args.connector_limit)
+    request_client.session = aiohttp.ClientSession(headers=headers, connector=pool.connector,
+                                                   trace_configs=[pool.trace_config()])
+
+    method = client._resolve(args.method)
+    latencies = []
+    errors = 0
+    in_flight = 0
+    max_in_flight = 0
+    remaining = iter(range(args.requests))
+
+    async def worker():
+        nonlocal errors, in_flight, max_in_flight
+        for _ in remaining:
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            start = time.perf_counter()
+            try:
+                await method(*args.args)
+            except Exception:
+                errors += 1
+            else:
+                latencies.append(time.perf_counter() - start)
+            finally:
+                in_flight -= 1
+
+    rss_before = peak_rss_mb()
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(args.concurrency)))
+    elapsed = time.perf_counter() - start
+    await client.request_client.close()
+
+    latencies.sort()
+    ms = 1000.0
+    print('method: {}({})'.format(args.method, ', '.join(args.args)))
+    print('requests: {:,d}  errors: {:,d}  concurrency: {}  max awaiting: {}'.format(
+        args.requests, errors, args.concurrency, max_in_flight))
+    print('pool: limit {}  peak connections in use {}  connections created {}  peak queued {}'.format(
+        args.connector_limit or 'none', pool.peak_in_use, pool.created, pool.peak_queued))
+    if pool.waits:
+        waits = sorted(pool.waits)
+        print('queue wait ({:,d} queued): p50 {:.1f} ms  p95 {:.1f} ms  p99 {:.1f} ms  max {:.1f} ms'.format(
+            len(waits), percentile(waits, 0.50) * ms, percentile(waits, 0.95) * ms,
+            percentile(waits, 0.99) * ms, waits[-1] * ms))
+    print('throughput: {:,.1f} req/s'.format(len(latencies) / elapsed))
+    if latencies:
+        print('latency: p50 {:.1f} ms  p95 {:.1f} ms  p99 {:.1f} ms  max {:.1f} ms'.format(
+            percentile(latencies, 0.50) * ms, percentile(latencies, 0.95) * ms,
+            percentile(latencies, 0.99) * ms, latencies[-1] * ms))
+    peak = peak_rss_mb()
+    print('peak RSS: {:.1f} MB  (~{:.1f} KB per awaiting request)'.format(
+        peak, max(peak - rss_before, 0) * 1024.0 / max(max_in_flight, 1)))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--method', default='country', help="Client method, e.g. 'all_countries' or 'influenza.ilinet'")
+    parser.add_argument('--args', nargs='*', default=['UK'])
+    parser.add_argument('--requests', type=int, default=5000)
+    parser.add_argument('--concurrency', type=int, default=1000)
+    parser.add_argument('--rows', type=int, default=200, help='rows in list payloads')
+    parser.add_argument('--latency', type=float, default=20.0, help='server latency in ms')
+    parser.add_argument('--jitter', type=float, default=10.0, help='random latency jitter in ms')
+    parser.add_argument('--connector-limit', type=int, default=100,
+                        help="connection pool size of the client's aiohttp connector, 0 for no limit")
+    args = parser.parse_args()
+
+    port = free_port()
+    server = multiprocessing.Process(target=serve, args=(port, args.rows, args.latency, args.jitter), daemon=True)
+    server.start()
+
+    try:
+        deadline = time.time() + 10
+        while True:
+            try:
+                socket.create_connection(('127.0.0.1', port), timeout=0.2).close()
+                break
+            except OSError:
+                if time.time() > deadline:
+                    raise
+                time.sleep(0.05)
+
+        asyncio.get_event_loop().run_until_complete(drive(args, 'http://127.0.0.1:{}/v3'.format(port)))
+    finally:
+        server.terminate()
+
+
+if __name__ == '__main__':
+    main()
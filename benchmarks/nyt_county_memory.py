@@ -0,0 +1,93 @@
+"""
+Measures the memory retained by the compiled result of `nyt_counties()`.
+
+Compares the compilers of `Covid`, which intern repeated names and share parsed dates,
+with compiling every row into fresh objects.
+
+Usage: python benchmarks/nyt_county_memory.py [--file counties.json] [--counties N] [--days N]
+Without --file a synthetic payload shaped like the NYT county data is used.
+"""
+import argparse
+import gc
+import json
+import os
+import sys
+import tracemalloc
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from diseaseapi.covid import Covid
+from diseaseapi.covidstatistics import NewYorkTimesCounty
+
+
+def synthetic(counties, days):
+    start = datetime(2020, 3, 1)
+    rows = [
+        {
+            "date": (start + timedelta(days=d)).strftime('%Y-%m-%d'),
+            "county": "County {}".format(c),
+            "state": "State {}".format(c % 55),
+            "fips": str(1000 + c),
+            "cases": c * d,
+            "deaths": d
+        }
+        for d in range(days) for c in range(counties)
+    ]
+    # round trip through JSON so that every string is a separate object, as in a real response
+    return json.loads(json.dumps(rows))
+
+
+def plain(data):
+    return [
+        NewYorkTimesCounty(
+            datetime.strptime(d['date'], "%Y-%m-%d") if d.get('date') else None,
+            d.get('county'),
+            d.get('state'),
+            d.get('fips'),
+            d.get('cases'),
+            d.get('deaths')
+        )
+        for d in data
+    ]
+
+
+def retained(load, compile):
+    gc.collect()
+    tracemalloc.start()
+    data = load()
+    result = compile(data)
+    del data
+    gc.collect()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return len(result), current, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--file', help='JSON file with a saved /nyt/counties response')
+    parser.add_argument('--counties', type=int, default=3200)
+    parser.add_argument('--days', type=int, default=60)
+    args = parser.parse_args()
+
+    if args.file:
+        def load():
+            with open(args.file) as f:
+                return json.load(f)
+    else:
+        def load():
+            return synthetic(args.counties, args.days)
+
+    rows, plain_current, plain_peak = retained(load, plain)
+    _, current, peak = retained(load, Covid('', None)._compile_county_list)
+
+    mb = 1024 * 1024
+    print('rows: {:,d}'.format(rows))
+    print('fresh objects:        retained {:8.1f} MB, peak {:8.1f} MB'.format(plain_current / mb, plain_peak / mb))
+    print('interned and shared:  retained {:8.1f} MB, peak {:8.1f} MB'.format(current / mb, peak / mb))
+    print('saved: {:.1f}%'.format(100.0 * (plain_current - current) / plain_current))
+
+
+if __name__ == '__main__':
+    main()
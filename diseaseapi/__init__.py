@@ -1,7 +1,49 @@
-from .client import Client
+import importlib as _importlib
 from .utils import *
 from .exceptions import *
 
 __version__ = "1.2.0"
 __author__ = "Rob Wainwright // apex2504"
-__license__ = "MIT"
\ No newline at end of file
+__license__ = "MIT"
+
+# Heavy modules (aiohttp and the API wrappers) are only imported when first used,
+# so that `import diseaseapi` stays cheap for scripts that only need the helpers.
+_LAZY_ATTRIBUTES = {
+    'Client': '.client',
+    'Covid': '.covid',
+    'Influenza': '.influenza',
+    'RequestClient': '.request',
+    'FreshnessPolicy': '.freshness',
+    'HistoryStore': '.store',
+    'HedgePolicy': '.hedging',
+    'INTERACTIVE': '.scheduler',
+    'NORMAL': '.scheduler',
+    'BACKGROUND': '.scheduler',
+}
+
+__all__ = [
+    'format_date', 'parse_date', 'format_number',
+    'APIError', 'ServerError', 'NotFound', 'BadSortParameter', 'BadYesterdayParameter',
+    'BadTwoDaysAgoParameter', 'BadAllowNoneParameter',
+] + list(_LAZY_ATTRIBUTES)
+
+_LAZY_MODULES = (
+    'cache', 'client', 'columnar', 'covid', 'covidendpoints', 'covidstatistics', 'export', 'freshness',
+    'govschema', 'hedging', 'influenza', 'influenzaendpoints', 'influenzastatistics', 'mirrors', 'reconcile', 'request', 'resolver', 'rollup', 'scheduler', 'spatial', 'store', 'watch',
+)
+
+
+def __getattr__(name):
+    if name in _LAZY_ATTRIBUTES:
+        value = getattr(_importlib.import_module(_LAZY_ATTRIBUTES[name], __name__), name)
+    elif name in _LAZY_MODULES:
+        value = _importlib.import_module('.' + name, __name__)
+    else:
+        raise AttributeError("module '{}' has no attribute '{}'".format(__name__, name))
+
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES) | set(_LAZY_MODULES))
@@ -0,0 +1,54 @@
+"""
+Command line entry point.
+
+Usage: python -m diseaseapi export DATASET OUTPUT [ARGS ...] [--format csv|ndjson|parquet]
+                                   [--last-days N] [--row-group-size N] [--base-url URL]
+
+e.g. python -m diseaseapi export nyt_counties counties.parquet
+     python -m diseaseapi export apple_mobility_data london.csv UK London
+"""
+import argparse
+import asyncio
+import sys
+import aiohttp
+
+from .client import Client
+from .exceptions import APIError
+from .export import DATASETS, FORMATS, export
+
+
+async def _export(args):
+    client = Client(args.base_url)
+
+    try:
+        return await export(client, args.dataset, args.output, *args.args, fmt=args.format,
+                            last_days=args.last_days, row_group_size=args.row_group_size)
+    finally:
+        await client.request_client.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m diseaseapi', description=__doc__.strip().splitlines()[0])
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    sub = commands.add_parser('export', help='stream a bulk dataset to a CSV, NDJSON or Parquet file')
+    sub.add_argument('dataset', choices=sorted(DATASETS))
+    sub.add_argument('output')
+    sub.add_argument('args', nargs='*', help='endpoint arguments, e.g. the country and subregion for apple_mobility_data')
+    sub.add_argument('--format', choices=FORMATS, default=None, help='defaults to the extension of OUTPUT')
+    sub.add_argument('--last-days', default='all')
+    sub.add_argument('--row-group-size', type=int, default=100000)
+    sub.add_argument('--base-url', default='https://disease.sh/v3')
+
+    args = parser.parse_args(argv)
+
+    try:
+        count = asyncio.run(_export(args))
+    except (ImportError, ValueError, APIError, aiohttp.ClientError) as e:
+        parser.exit(1, '{}\n'.format(e))
+
+    print('Wrote {} rows to {}'.format(count, args.output), file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,342 @@
+import sys
+import time
+import weakref
+from collections import OrderedDict
+
+
+def cache_key(endpoint, params=None):
+    """
+    Build a hashable key for a request.
+    """
+    if not params:
+        return (endpoint, ())
+
+    return (endpoint, tuple(sorted((k, str(v)) for k, v in params.items())))
+
+
+def estimate_size(obj, sample=32):
+    """
+    Estimate the memory used by an object and everything it references, in bytes.
+    Only the first `sample` items of large containers are measured and the rest are extrapolated.
+    """
+    seen = set()
+
+    def size(o):
+        if id(o) in seen:
+            return 0
+        seen.add(id(o))
+
+        total = sys.getsizeof(o)
+
+        if isinstance(o, (str, bytes, int, float, bool)) or o is None:
+            return total
+
+        if isinstance(o, dict):
+            items = o.items()
+            children = [c for item in _take(items, sample) for c in item]
+            count = len(o)
+        elif isinstance(o, (list, tuple, set, frozenset)):
+            children = list(_take(o, sample))
+            count = len(o)
+        elif hasattr(o, '__dict__'):
+            return total + size(vars(o))
+        else:
+            return total
+
+        measured = sum(size(c) for c in children)
+
+        if count > sample:
+            measured = measured * count // sample
+
+        return total + measured
+
+    return size(obj)
+
+
+def _take(iterable, n):
+    for i, item in enumerate(iterable):
+        if i == n:
+            return
+        yield item
+
+
+class LRUStore:
+    """
+    Least recently used store with an optional budget in bytes, shared by the response and model caches.
+    """
+    def __init__(self, max_bytes=None):
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._entries = OrderedDict()
+        self._evict_callbacks = []
+
+    def __len__(self):
+        return len(self._entries)
+
+    def on_evict(self, callback):
+        self._evict_callbacks.append(callback)
+
+    def get(self, key):
+        item = self._entries.get(key)
+
+        if item is None:
+            return None
+
+        self._entries.move_to_end(key)
+        return item[0]
+
+    def peek(self, key):
+        """
+        Get a value without marking it as recently used.
+        """
+        item = self._entries.get(key)
+        return None if item is None else item[0]
+
+    def put(self, key, value, size=0):
+        """
+        Store a value. Returns False if it is larger than the whole budget and was not stored.
+        """
+        self.pop(key)
+
+        if self.max_bytes is not None and size > self.max_bytes:
+            return False
+
+        self._entries[key] = (value, size)
+        self.size += size
+
+        while self.max_bytes is not None and self.size > self.max_bytes:
+            old_key, (old_value, old_size) = self._entries.popitem(last=False)
+            self.size -= old_size
+            for callback in self._evict_callbacks:
+                callback(old_key, old_value)
+
+        return True
+
+    def pop(self, key):
+        item = self._entries.pop(key, None)
+
+        if item is None:
+            return None
+
+        self.size -= item[1]
+        return item[0]
+
+    def clear(self):
+        self._entries.clear()
+        self.size = 0
+
+
+class CacheEntry:
+    def __init__(self, data, expires, fingerprint=None):
+        self.data = data
+        self.expires = expires
+        self.fingerprint = fingerprint
+
+
+class ResponseCache:
+    """
+    Stores decoded responses until the time given by the freshness policy.
+    Holds at most `maxsize` responses; expired ones are purged first, then the least recently used.
+    """
+    def __init__(self, store=None, maxsize=1024):
+        self.store = store if store is not None else LRUStore()
+        self.maxsize = maxsize
+        self._budgeted = self.store.max_bytes is not None
+        self._keys = OrderedDict()
+        self.store.on_evict(self._evicted)
+
+    def __len__(self):
+        return len(self._keys)
+
+    def get(self, key, now=None):
+        entry = self.store.get(('response', key))
+
+        if entry is None:
+            self._keys.pop(key, None)
+            return None
+
+        if entry.expires <= (time.time() if now is None else now):
+            self._drop(key)
+            return None
+
+        self._keys.move_to_end(key)
+        return entry
+
+    def put(self, key, data, expires, fingerprint=None, now=None):
+        entry = CacheEntry(data, expires, fingerprint)
+        self._keys.pop(key, None)
+
+        if self.maxsize is not None and len(self._keys) >= self.maxsize:
+            self.purge(now)
+
+            while len(self._keys) >= self.maxsize:
+                self._drop(next(iter(self._keys)))
+
+        if self.store.put(('response', key), entry, estimate_size(data) if self._budgeted else 0):
+            self._keys[key] = None
+
+        return entry
+
+    def purge(self, now=None):
+        """
+        Drop every expired response.
+        """
+        now = time.time() if now is None else now
+
+        for key in list(self._keys):
+            entry = self.store.peek(('response', key))
+            if entry is None or entry.expires <= now:
+                self._drop(key)
+
+    def expires(self, key):
+        entry = self.store.get(('response', key))
+        return entry.expires if entry else None
+
+    def _drop(self, key):
+        self.store.pop(('response', key))
+        self._keys.pop(key, None)
+
+    def _evicted(self, key, value):
+        if key[0] == 'response':
+            self._keys.pop(key[1], None)
+
+    def clear(self):
+        for key in self._keys:
+            self.store.pop(('response', key))
+        self._keys.clear()
+
+
+class ModelList(list):
+    """
+    A list of compiled models. Unlike a plain list it can be weakly referenced.
+    """
+    pass
+
+
+class ModelCache:
+    """
+    Keeps compiled models so that an unchanged response is not compiled again.
+
+    Models are kept within the byte budget of the store, least recently used first out.
+    Evicted models are still reused while the caller holds on to them, through weak references.
+    """
+    def __init__(self, store):
+        self.store = store
+        self._weak = weakref.WeakValueDictionary()
+        self._weak_fingerprints = {}
+        store.on_evict(self._evicted)
+
+    def get(self, key, fingerprint):
+        item = self.store.get(('model', key))
+
+        if item is not None and item[0] == fingerprint:
+            return item[1]
+
+        model = self._weak.get(key)
+
+        if model is not None and self._weak_fingerprints.get(key) == fingerprint:
+            self.put(key, fingerprint, model)
+            return model
+
+        return None
+
+    def put(self, key, fingerprint, model):
+        """
+        Store a model and return it. Lists are returned as a `ModelList`.
+        """
+        if type(model) is list:
+            model = ModelList(model)
+
+        if not self.store.put(('model', key), (fingerprint, model), estimate_size(model)):
+            self._evicted(('model', key), (fingerprint, model))
+
+        return model
+
+    def _evicted(self, key, value):
+        if key[0] != 'model':
+            return
+
+        key = key[1]
+        fingerprint, model = value
+
+        try:
+            self._weak[key] = model
+        except TypeError:
+            return
+
+        self._weak_fingerprints[key] = fingerprint
+
+        for stale in [k for k in self._weak_fingerprints if k not in self._weak]:
+            del self._weak_fingerprints[stale]
+
+
+class NegativeCache:
+    """
+    Remembers requests that ended in NotFound for a short time, so that repeated misses fail without a request.
+    Holds at most `maxsize` entries, dropping the oldest first.
+    """
+    def __init__(self, ttl=60, maxsize=1024):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key, now=None):
+        """
+        Get the message of a remembered miss, or None.
+        """
+        entry = self._entries.get(key)
+
+        if entry is None:
+            return None
+
+        expires, message = entry
+
+        if expires <= (time.monotonic() if now is None else now):
+            del self._entries[key]
+            return None
+
+        return message
+
+    def add(self, key, message, now=None):
+        self._entries.pop(key, None)
+        self._entries[key] = ((time.monotonic() if now is None else now) + self.ttl, message)
+
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        self._entries.clear()
+
+
+class EntityCache:
+    """
+    Keeps recently compiled entities (countries, continents etc.), keyed on their identity and upstream `updated` stamp.
+    Holds at most `maxsize` entities, dropping the least recently used first.
+    """
+    def __init__(self, maxsize=4096):
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key):
+        entity = self._entries.get(key)
+
+        if entity is not None:
+            self._entries.move_to_end(key)
+
+        return entity
+
+    def put(self, key, entity):
+        self._entries[key] = entity
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        self._entries.clear()
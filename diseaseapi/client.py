@@ -1,10 +1,133 @@
+import asyncio
+import copy
+import time
 from .covid import Covid
 from .influenza import Influenza
+from .mirrors import MirrorPool
 from .request import RequestClient
+from .watch import WatchHub
+
+DEFAULT_WARM_UP = ('all', 'all_countries', 'all_states', 'all_continents', 'jhucsse')
+
+
+class WarmUpResult:
+    def __init__(self, name, elapsed, error=None):
+        self.name = name
+        self.elapsed = elapsed
+        self.error = error
+
+    @property
+    def ok(self):
+        return self.error is None
+
 
 class Client:
-    def __init__(self, base_url='https://disease.sh/v3'):
-        self.request_client = RequestClient()
+    def __init__(self, base_url='https://disease.sh/v3', freshness_policy=None, negative_cache_ttl=30, memory_budget=None,
+                hedge_policy=None, max_concurrency=None):
+        mirrors = None
+
+        if isinstance(base_url, (list, tuple)):
+            mirrors = MirrorPool(base_url)
+            base_url = mirrors.primary
+
+        self.request_client = RequestClient(freshness_policy, negative_cache_ttl, memory_budget, hedge_policy, mirrors,
+                                            max_concurrency)
         self.base_url = base_url
         self.covid19 = Covid(base_url, self.request_client)
-        self.influenza = Influenza(base_url, self.request_client)
\ No newline at end of file
+        self.influenza = Influenza(base_url, self.request_client)
+        self._watch_hub = WatchHub()
+
+
+    def with_priority(self, priority):
+        """
+        Get a view of this client whose requests are made with the given priority
+        (`diseaseapi.INTERACTIVE`, `diseaseapi.NORMAL` or `diseaseapi.BACKGROUND`).
+        The view shares the session, caches, concurrency limit and name resolver of this client.
+        """
+        view = copy.copy(self)
+        view.request_client = self.request_client.with_priority(priority)
+        view.covid19 = copy.copy(self.covid19)
+        view.covid19.request_client = view.request_client
+        view.influenza = copy.copy(self.influenza)
+        view.influenza.request_client = view.request_client
+
+        return view
+
+
+    def watch(self, method, *args, **kwargs):
+        """
+        Subscribe to the changes of a resource, e.g. `client.watch(client.covid19.country, 'UK', interval=60)`.
+
+        Every subscription to the same method and arguments shares one poller, which calls the method every
+        `interval` seconds (60 by default) and emits a value only when its `updated` stamp or contents change.
+        Polling stops once every subscription has been closed.
+        """
+        return self._watch_hub.watch(method, *args, **kwargs)
+
+
+    async def export(self, dataset, path, *args, **kwargs):
+        """
+        Stream a bulk dataset ('nyt_counties', 'jhu_all_counties', 'vaccine_countries' or 'apple_mobility_data')
+        to a CSV, NDJSON or Parquet file without holding it in memory. Returns the number of rows written.
+        See `diseaseapi.export.export`.
+        """
+        from .export import export
+
+        return await export(self, dataset, path, *args, **kwargs)
+
+
+    def _resolve(self, name):
+        if name.startswith('influenza.'):
+            target, attr = self.influenza, name[len('influenza.'):]
+        else:
+            target, attr = self.covid19, name[len('covid19.'):] if name.startswith('covid19.') else name
+
+        method = None if attr.startswith('_') else getattr(target, attr, None)
+
+        if not callable(method):
+            raise ValueError('Unknown endpoint: {}.'.format(name))
+
+        return method
+
+
+    async def warm_up(self, endpoints=DEFAULT_WARM_UP, timeout=30):
+        """
+        Fetch several endpoints concurrently so that later calls are served from the cache.
+        Endpoints are the names of `Covid` methods, or `influenza.` followed by the name of an `Influenza` method.
+
+        Returns a dict mapping each endpoint to a `WarmUpResult` with its timing and any error.
+        Failures and endpoints still running after `timeout` seconds do not stop the others.
+        Raises ValueError if the client was created without a `freshness_policy`, as nothing would be kept,
+        or if an endpoint name is unknown, before anything is fetched.
+        """
+        if self.request_client.cache is None:
+            raise ValueError('warm_up() needs a response cache. Create the client with a freshness_policy, '
+                             'e.g. Client(freshness_policy=diseaseapi.FreshnessPolicy()).')
+
+        methods = {name: self._resolve(name) for name in endpoints}
+
+        if not methods:
+            return {}
+
+        start = time.perf_counter()
+        results = {}
+
+        async def fetch(name):
+            try:
+                await methods[name]()
+            except Exception as e:
+                results[name] = WarmUpResult(name, time.perf_counter() - start, e)
+            else:
+                results[name] = WarmUpResult(name, time.perf_counter() - start)
+
+        tasks = [asyncio.ensure_future(fetch(name)) for name in methods]
+        _, pending = await asyncio.wait(tasks, timeout=timeout)
+
+        for task in pending:
+            task.cancel()
+
+        for name in methods:
+            if name not in results:
+                results[name] = WarmUpResult(name, time.perf_counter() - start, asyncio.TimeoutError())
+
+        return {name: results[name] for name in methods}
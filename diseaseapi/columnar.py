@@ -0,0 +1,130 @@
+from array import array
+from datetime import datetime
+from math import isnan
+
+NAN = float('nan')
+
+
+def int_column(values=()):
+    """
+    Build a typed column of 64 bit integers. Missing values are stored as 0.
+    """
+    return array('q', (int(v or 0) for v in values))
+
+
+def float_column(values=()):
+    """
+    Build a typed column of floats. Missing values are stored as NaN.
+    """
+    return array('d', (NAN if v is None else float(v) for v in values))
+
+
+def _rolling(column, window, mean):
+    if window < 1:
+        raise ValueError('window should be at least 1.')
+
+    out = array('d')
+    total = 0.0
+    count = 0
+
+    for i, value in enumerate(column):
+        if not isnan(value):
+            total += value
+            count += 1
+
+        if i >= window:
+            old = column[i - window]
+            if not isnan(old):
+                total -= old
+                count -= 1
+
+        if i >= window - 1:
+            if not count:
+                out.append(NAN)
+            else:
+                out.append(total / count if mean else total)
+
+    return out
+
+
+def rolling_sum(column, window):
+    """
+    Sum of every `window` consecutive values, ignoring NaN values.
+    The result has `len(column) - window + 1` entries.
+    """
+    return _rolling(column, window, False)
+
+
+def rolling_mean(column, window):
+    """
+    Mean of every `window` consecutive values, ignoring NaN values.
+    The result has `len(column) - window + 1` entries.
+    """
+    return _rolling(column, window, True)
+
+
+def group_sum(column, groups):
+    """
+    Sum the column over each group of row positions.
+    `groups` maps a label to a list of row positions, the result maps the same labels to their totals.
+    """
+    totals = {}
+
+    for label, rows in groups.items():
+        total = 0
+        for row in rows:
+            value = column[row]
+            if not (isinstance(value, float) and isnan(value)):
+                total += value
+        totals[label] = total
+
+    return totals
+
+
+def date_axis(series, fmt):
+    """
+    Build one shared, sorted date axis for several timelines keyed by date strings.
+    Each distinct date string is parsed only once.
+
+    Returns the list of dates and a dict mapping every date string to its position on the axis.
+    """
+    parsed = {}
+
+    for timeline in series:
+        for key in timeline:
+            if key not in parsed:
+                parsed[key] = datetime.strptime(key, fmt)
+
+    dates = sorted(set(parsed.values()))
+    position = {date: i for i, date in enumerate(dates)}
+
+    return dates, {key: position[date] for key, date in parsed.items()}
+
+
+def fill_matrix(series, positions, width):
+    """
+    Lay timelines out as the rows of a flat row-major integer matrix of `width` columns.
+    Dates missing from a timeline are stored as 0.
+    """
+    matrix = array('q', bytes(8 * width * len(series)))
+
+    for row, timeline in enumerate(series):
+        offset = row * width
+        for key, value in timeline.items():
+            matrix[offset + positions[key]] = int(value or 0)
+
+    return matrix
+
+
+def diff(column):
+    """
+    Difference between each integer value and the previous one. The first value is kept as is.
+    """
+    out = array('q')
+    previous = 0
+
+    for value in column:
+        out.append(value - previous)
+        previous = value
+
+    return out
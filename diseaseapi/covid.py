@@ -1,8 +1,25 @@
-from datetime import datetime, timezone
+import asyncio
+import sys
+from datetime import date, datetime, timezone
+from urllib.parse import quote
 from typing import Union, List, Dict, Tuple
 from .covidstatistics import *
+from .covidstatistics import _as_datetime
 from .exceptions import NotFound, BadSortParameter, BadYesterdayParameter, BadTwoDaysAgoParameter, BadAllowNoneParameter
 from .covidendpoints import *
+from .columnar import date_axis, fill_matrix, float_column
+from .govschema import GovSchema, GovTable, SchemaMismatch
+from .reconcile import Reconciler
+from .resolver import LocationResolver
+from .rollup import Rollup
+from .spatial import SpatialIndex
+from .cache import EntityCache, cache_key
+
+
+class _SharedState:
+    def __init__(self):
+        self.resolver = None
+        self.rollup = None
 
 
 class Covid:
@@ -12,6 +29,23 @@ class Covid:
     def __init__(self, api_url, request_client):
         self.api_url = api_url
         self.request_client = request_client
+        self._gov_schemas = {}
+        self._country_infos = {}
+        self._dates = {}
+        self._entities = EntityCache()
+        self._spatial = {}
+        # state which is replaced rather than mutated lives here, so that priority views see it too
+        self._shared = _SharedState()
+
+
+    @property
+    def resolver(self):
+        return self._shared.resolver
+
+
+    @resolver.setter
+    def resolver(self, value):
+        self._shared.resolver = value
 
 
     def _check_sort(self, sort):
@@ -37,6 +71,61 @@ class Covid:
             raise BadAllowNoneParameter('Value for allow_none should either be True or False.')
 
 
+    async def _request_compiled(self, kind, endpoint, params, compiler):
+        models = self.request_client.models
+
+        if models is None:
+            return compiler(await self.request_client.make_request(endpoint, params))
+
+        data, fingerprint = await self.request_client.fetch(endpoint, params)
+        key = (kind, cache_key(endpoint, params))
+        model = models.get(key, fingerprint)
+
+        if model is None:
+            model = models.put(key, fingerprint, compiler(data))
+
+        return model
+
+
+    def _resolve(self, kind, name):
+        if self.resolver is None:
+            return name
+
+        return getattr(self.resolver, kind)(name)
+
+
+    def _intern(self, value):
+        return sys.intern(value) if isinstance(value, str) else value
+
+
+    def _parse_date(self, value, fmt):
+        # bulk data repeats the same few hundred dates on every row, so parse each once and share the result
+        key = (value, fmt)
+        parsed = self._dates.get(key)
+
+        if parsed is None:
+            if len(self._dates) >= 100000:
+                self._dates.clear()
+            parsed = self._dates[key] = datetime.strptime(value, fmt)
+
+        return parsed
+
+
+    def _cached_entity(self, kind, variant, name, updated, build):
+        # an entity whose upstream `updated` stamp has not changed since it was last compiled is returned as is
+        if not updated:
+            return build()
+
+        key = (kind, variant, name, updated)
+        entity = self._entities.get(key)
+
+        if entity is None:
+            entity = build()
+            self._entities.put(key, entity)
+
+        return entity
+
+
     def _compile_today(self, data):
         return Today(
             data.get('todayCases'),
@@ -87,19 +176,28 @@ class Covid:
         _long = countryInfo.get("long")
         flag = countryInfo.get("flag")
 
-        info = CountryInfo(
-            _id,
-            iso2,
-            iso3,
-            _lat,
-            _long,
-            flag
-        )
+        key = (_id, iso2, iso3, _lat, _long, flag)
+        info = self._country_infos.get(key)
+
+        if info is None:
+            info = self._country_infos[key] = CountryInfo(
+                _id,
+                iso2,
+                iso3,
+                _lat,
+                _long,
+                flag
+            )
 
         return info
 
 
-    def _compile_country_data(self, country_stats):
+    def _compile_country_data(self, country_stats, variant=None):
+        return self._cached_entity('country', variant, country_stats.get("country"), country_stats.get("updated"),
+            lambda: self._build_country_data(country_stats))
+
+
+    def _build_country_data(self, country_stats):
         country_name = country_stats.get("country")
         total_country_cases = country_stats.get("cases", 0)
         total_country_deaths = country_stats.get("deaths", 0)
@@ -137,6 +235,37 @@ class Covid:
         )
 
 
+    def _compile_global(self, global_data):
+        cases = global_data.get("cases", 0)
+        deaths = global_data.get("deaths", 0)
+        recoveries = global_data.get("recovered", 0)
+        today = self._compile_today(global_data)
+        total_critical = global_data.get("critical", 0)
+        updated_epoch = global_data.get("updated", 0)
+        active = global_data.get("active", 0)
+        tests = global_data.get("tests", 0)
+        per_million = self._compile_permillion(global_data)
+        per_people = self._compile_perpeople(global_data)
+        population = global_data.get("population", 0)
+        affected_countries = global_data.get("affectedCountries")
+        updated = datetime.utcfromtimestamp(updated_epoch/1000.0)
+
+        return Global(
+            cases,
+            deaths,
+            recoveries,
+            today,
+            total_critical,
+            active,
+            tests,
+            per_million,
+            per_people,
+            population,
+            affected_countries,
+            updated,
+            )
+
+
     def _compile_state(self, state_dict):
         state_name = state_dict.get("state")
         total_state_cases = state_dict.get("cases", 0)
@@ -184,7 +313,7 @@ class Covid:
             case_history.append(HistoryEntry(_d, d["cases"][date]))
             death_history.append(HistoryEntry(_d, d["deaths"][date]))
             if not is_county:
-                recovery_history.append(HistoryEntry(date, d["recovered"][date]))
+                recovery_history.append(HistoryEntry(_d, d["recovered"][date]))
 
         his = History(
             case_history,
@@ -200,16 +329,16 @@ class Covid:
 
 
     def _compile_jhu_data(self, matching_county):
-        country = matching_county.get("country") #will always be 'US'
-        province = matching_county.get("province")
-        county_name = matching_county.get("county")
+        country = self._intern(matching_county.get("country")) #will always be 'US'
+        province = self._intern(matching_county.get("province"))
+        county_name = self._intern(matching_county.get("county"))
         confirmed_cases = matching_county["stats"].get("confirmed")
         deaths = matching_county["stats"].get("deaths")
         recoveries = matching_county["stats"].get("recovered")
         _lat = float(matching_county["coordinates"].get("latitude")) if matching_county["coordinates"].get("latitude") else 0.0
         _long = float(matching_county["coordinates"].get("longitude")) if matching_county["coordinates"].get("longitude") else 0.0
 
-        updated = datetime.strptime(matching_county.get('updatedAt'), '%Y-%m-%d %H:%M:%S')
+        updated = self._parse_date(matching_county.get('updatedAt'), '%Y-%m-%d %H:%M:%S')
 
         stat = JhuCsse(
                 country,
@@ -226,7 +355,12 @@ class Covid:
         return stat
 
 
-    def _compile_continent(self, data):
+    def _compile_continent(self, data, variant=None):
+        return self._cached_entity('continent', variant, data.get('continent'), data.get('updated'),
+            lambda: self._build_continent(data))
+
+
+    def _build_continent(self, data):
         name = data.get('continent')
         countries = data.get('countries')
         cases = data.get("cases", 0)
@@ -267,13 +401,13 @@ class Covid:
 
     def _compile_nyt_state(self, data):
         date = data.get('date')
-        state = data.get('state')
+        state = self._intern(data.get('state'))
         fips = data.get('fips')
         cases = data.get('cases')
         deaths = data.get('deaths')
 
         if date:
-            date = datetime.strptime(date, "%Y-%m-%d")
+            date = self._parse_date(date, "%Y-%m-%d")
 
         return NewYorkTimesState(
             date,
@@ -286,14 +420,14 @@ class Covid:
 
     def _compile_nyt_county(self, data):
         date = data.get('date')
-        county = data.get('county')
-        state = data.get('state')
+        county = self._intern(data.get('county'))
+        state = self._intern(data.get('state'))
         fips = data.get('fips')
         cases = data.get('cases')
         deaths = data.get('deaths')
 
         if date:
-            date = datetime.strptime(date, "%Y-%m-%d")
+            date = self._parse_date(date, "%Y-%m-%d")
 
         return NewYorkTimesCounty(
             date,
@@ -306,15 +440,15 @@ class Covid:
 
 
     def _compile_apple_stats(self, data):
-        name = data.get("subregion_and_city")
-        _type = data.get("get_type")
+        name = self._intern(data.get("subregion_and_city"))
+        _type = self._intern(data.get("get_type"))
         date = data.get("date")
         driving = data.get("driving")
         transit = data.get("transit")
         walking = data.get("walking")
 
         if date:
-            date = datetime.strptime(date, "%Y-%m-%d")
+            date = self._parse_date(date, "%Y-%m-%d")
 
         return Mobility(
             name,
@@ -354,9 +488,111 @@ class Covid:
         return VaccineCountry(data['country'], self._compile_vax_tl(data['timeline']))
 
 
+    def _chunk_countries(self, countries):
+        base = len(HISTORICAL_COUNTRY.format(self.api_url, ''))
+        chunks = []
+        chunk = []
+        length = base
+
+        for country in countries:
+            size = len(quote(country)) + 3 #separating comma once encoded
+            if chunk and length + size > MAX_URL_LENGTH:
+                chunks.append(chunk)
+                chunk = []
+                length = base
+            chunk.append(country)
+            length += size
+
+        if chunk:
+            chunks.append(chunk)
+
+        return chunks
+
+
+    def _compile_history_matrix(self, data):
+        entries = [entry for entry in data if isinstance(entry, dict) and isinstance(entry.get("timeline"), dict)]
+        timelines = [entry["timeline"] for entry in entries]
+        dates, positions = date_axis((t.get("cases", {}) for t in timelines), '%m/%d/%y')
+        width = len(dates)
+
+        return HistoryMatrix(
+            dates,
+            [entry.get("country") for entry in entries],
+            fill_matrix([t.get("cases", {}) for t in timelines], positions, width),
+            fill_matrix([t.get("deaths", {}) for t in timelines], positions, width),
+            fill_matrix([t.get("recovered", {}) for t in timelines], positions, width)
+        )
+
+
+    def _compile_vax_matrix(self, data):
+        timelines = [country['timeline'] for country in data]
+        dates, positions = date_axis(timelines, '%m/%d/%y')
+
+        return VaccineMatrix(
+            dates,
+            [country['country'] for country in data],
+            fill_matrix(timelines, positions, len(dates))
+        )
+
+
 ######################################################################################
 
 
+    async def build_resolver(self) -> LocationResolver:
+        """
+        Build a local index of country, state and continent names, ISO codes and common aliases.
+        Once built, names passed to country(), state(), continent(), country_history() and vaccine_country()
+        are corrected locally and unknown names raise NotFound without a request being made.
+        """
+        countries, states = await asyncio.gather(self.all_countries(), self.all_states())
+        self.resolver = LocationResolver(countries, states)
+
+        return self.resolver
+
+
+    async def snapshot(self, *parts, **kwargs) -> Snapshot:
+        """
+        Get several aggregates at once. The requests are made concurrently over the shared session.
+
+        Parts can be any of 'global_data', 'countries', 'continents', 'states' and 'vaccine_coverage'; all of them by default.
+        `yesterday` and `allow_none` are passed on to the parts that support them, `last_days` to vaccine_coverage.
+        """
+        yesterday = kwargs.get('yesterday', False)
+        allow_none = kwargs.get('allow_none', False)
+        last_days = kwargs.get('last_days', 'all')
+
+        fetchers = {
+            'global_data': lambda: self.all(yesterday=yesterday, allow_none=allow_none),
+            'countries': lambda: self.all_countries(yesterday=yesterday, allow_none=allow_none),
+            'continents': lambda: self.all_continents(yesterday=yesterday, allow_none=allow_none),
+            'states': lambda: self.all_states(yesterday=yesterday, allow_none=allow_none),
+            'vaccine_coverage': lambda: self.vaccine_coverage(last_days)
+        }
+
+        parts = parts or tuple(fetchers)
+
+        for part in parts:
+            if part not in fetchers:
+                raise ValueError('Unknown snapshot part: {}.'.format(part))
+
+        fetched = datetime.utcnow()
+        results = await asyncio.gather(*(fetchers[part]() for part in parts))
+        data = dict(zip(parts, results))
+
+        updated = {}
+        for part, result in data.items():
+            if isinstance(result, Global):
+                updated[part] = result.updated
+            elif part in ('countries', 'continents') and result:
+                updated[part] = max(r.updated for r in result)
+            elif part == 'vaccine_coverage' and result:
+                updated[part] = result[-1].date
+            else:
+                updated[part] = None
+
+        return Snapshot(fetched, updated, **data)
+
+
     async def all(self, **kwargs) -> Global:
         """
         Get the global stats for Coronavirus COVID-19
@@ -386,34 +622,8 @@ class Covid:
 
         global_data = await self.request_client.make_request(endpoint, params)
 
-        cases = global_data.get("cases", 0)
-        deaths = global_data.get("deaths", 0)
-        recoveries = global_data.get("recovered", 0)
-        today = self._compile_today(global_data)
-        total_critical = global_data.get("critical", 0)
-        updated_epoch = global_data.get("updated", 0)
-        active = global_data.get("active", 0)
-        tests = global_data.get("tests", 0)
-        per_million = self._compile_permillion(global_data)
-        per_people = self._compile_perpeople(global_data)
-        population = global_data.get("population", 0)
-        affected_countries = global_data.get("affectedCountries")
-        updated = datetime.utcfromtimestamp(updated_epoch/1000.0)
-
-        return Global(
-            cases,
-            deaths,
-            recoveries,
-            today,
-            total_critical,
-            active,
-            tests,
-            per_million,
-            per_people,
-            population,
-            affected_countries,
-            updated,
-            )
+        return self._cached_entity('global', (yesterday, two_days_ago, allow_none), None, global_data.get("updated"),
+            lambda: self._compile_global(global_data))
 
 
     async def country(self, *countries, **kwargs) -> Union[Country, List[Country]]:
@@ -423,7 +633,7 @@ class Covid:
         yesterday = kwargs.get('yesterday', False)
         two_days_ago = kwargs.get('two_days_ago', False)
         allow_none = kwargs.get('allow_none', False)
-        country_list = ','.join(map(str, countries))
+        country_list = ','.join(self._resolve('country', c) for c in map(str, countries))
 
         endpoint = COUNTRY_DATA.format(self.api_url, country_list)
 
@@ -447,9 +657,9 @@ class Covid:
         data = await self.request_client.make_request(endpoint, params)
 
         if isinstance(data, dict):
-            return self._compile_country_data(data)
+            return self._compile_country_data(data, (yesterday, two_days_ago, allow_none))
 
-        return [self._compile_country_data(country) for country in data]
+        return [self._compile_country_data(country, (yesterday, two_days_ago, allow_none)) for country in data]
 
 
     async def all_countries(self, **kwargs) -> List[Country]:
@@ -487,9 +697,64 @@ class Covid:
         else:
             params = {"yesterday": yesterday, "twoDaysAgo": two_days_ago, "allowNull": allow_none}
  
-        all_countries = await self.request_client.make_request(endpoint, params)
+        return await self._request_compiled('all_countries', endpoint, params,
+            lambda all_countries: [self._compile_country_data(c, (yesterday, two_days_ago, allow_none)) for c in all_countries])
+
+
+    async def rollup(self, **kwargs) -> Rollup:
+        """
+        Get continent and global totals computed locally from `all_countries()`, in one request.
+        Takes the same kwargs as `all_countries()`; e.g. `(await covid.rollup()).continent('Europe')`.
+        """
+        countries = await self.all_countries(**kwargs)
 
-        return [self._compile_country_data(c) for c in all_countries]
+        rollup = self._shared.rollup
+
+        if rollup is None or rollup.countries is not countries:
+            rollup = self._shared.rollup = Rollup(countries)
+
+        return rollup
+
+
+    async def spatial_index(self, source='jhu_all_counties', **kwargs) -> SpatialIndex:
+        """
+        Get a spatial index over the coordinates of `jhu_all_counties()` or `all_countries()`,
+        e.g. `(await covid.spatial_index()).nearest(51.5, -0.1, k=5)`.
+
+        The index is kept between calls and refreshed incrementally from the latest snapshot.
+        Other kwargs are passed on to `all_countries()`.
+        """
+        if source == 'jhu_all_counties':
+            places = await self.jhu_all_counties()
+        elif source == 'all_countries':
+            places = await self.all_countries(**kwargs)
+        else:
+            raise ValueError("source should be 'jhu_all_counties' or 'all_countries'.")
+
+        snapshot, index = self._spatial.get(source, (None, None))
+
+        if index is None:
+            index = SpatialIndex(places)
+        elif snapshot is not places:
+            index.update(places)
+
+        self._spatial[source] = (places, index)
+        return index
+
+
+    async def reconcile(self) -> Reconciler:
+        """
+        Fetch NYT counties and states, JHU counties and Worldometers states concurrently and join them
+        on FIPS codes and normalised names, e.g. `(await covid.reconcile()).county(fips=36047)`.
+        """
+        nyt_counties, jhu_counties, states, nyt_states = await asyncio.gather(
+            self.nyt_counties(),
+            self.jhu_all_counties(),
+            self.all_states(),
+            self.nyt_states()
+        )
+
+        return Reconciler(nyt_counties, jhu_counties, states, nyt_states)
 
 
     async def all_states(self, **kwargs) -> List[State]:
@@ -519,9 +784,8 @@ class Covid:
         else:
             params = {"yesterday": yesterday, "allowNull": allow_none}
 
-        state_info = await self.request_client.make_request(endpoint, params)
-
-        return [self._compile_state(state) for state in state_info]
+        return await self._request_compiled('all_states', endpoint, params,
+            lambda state_info: [self._compile_state(state) for state in state_info])
 
     
     async def state(self, *states, **kwargs) -> Union[State, List[State]]:
@@ -530,7 +794,7 @@ class Covid:
         """
         yesterday = kwargs.get('yesterday', False)
         allow_none = kwargs.get('allow_none', False)
-        state_list = ','.join(map(str, states))
+        state_list = ','.join(self._resolve('state', s) for s in map(str, states))
 
         endpoint = SINGLE_STATE.format(self.api_url, state_list)
 
@@ -557,12 +821,42 @@ class Covid:
         Get historical data for a specific country or globally.
         Defaults to 'all' in order to get global data. This can be overridden by the client.
         """
+        if str(country).lower() != 'all':
+            country = self._resolve('country', country)
+
         endpoint = HISTORICAL_COUNTRY.format(self.api_url, country)
         params = {"lastdays": last_days}
 
-        historical_stats = await self.request_client.make_request(endpoint, params)
+        return await self._request_compiled('country_history', endpoint, params, self._generate_history)
+
+
+    async def history_matrix(self, countries, last_days='all', countries_info=None) -> HistoryMatrix:
+        """
+        Get historical data for several countries as a matrix with a shared date axis.
+        Countries are requested together, in as few requests as the URL length allows, and the requests are made concurrently.
+        Pass a list of `Country` as `countries_info` to enable lookups by ISO code and per capita figures.
+        """
+        countries = [self._resolve('country', c) for c in map(str, countries)]
+        params = {"lastdays": last_days}
+
+        responses = await asyncio.gather(*(
+            self.request_client.make_request(HISTORICAL_COUNTRY.format(self.api_url, ','.join(chunk)), params)
+            for chunk in self._chunk_countries(countries)
+        ))
 
-        return self._generate_history(historical_stats)
+        data = []
+        for response in responses:
+            if isinstance(response, list):
+                data.extend(response)
+            else:
+                data.append(response)
+
+        matrix = self._compile_history_matrix(data)
+
+        if countries_info:
+            matrix.add_info(countries_info)
+
+        return matrix
 
 
     async def province_history(self, country, province, last_days='all') -> Historical:
@@ -583,6 +877,9 @@ class Covid:
         """
         endpoint = STATE_COUNTY.format(self.api_url, state)
         params = {"lastdays": last_days}
+        miss_key = ('county_history', state.lower(), county.lower())
+
+        self.request_client.check_not_found(miss_key)
 
         data = await self.request_client.make_request(endpoint, params)
 
@@ -590,6 +887,7 @@ class Covid:
             matching_county = next(place for place in data if place["province"].lower() == state.lower()
             and place["county"].lower() == county.lower())
         except StopIteration:
+            self.request_client.add_not_found(miss_key, 'Nothing found for specified county.')
             raise NotFound('Nothing found for specified county.')
 
         return self._generate_history(matching_county, True)
@@ -602,9 +900,8 @@ class Covid:
         """
         endpoint = JHU_CSSE.format(self.api_url)
 
-        data = await self.request_client.make_request(endpoint)
-
-        return [self._compile_jhu_data(cp) for cp in data]
+        return await self._request_compiled('jhucsse', endpoint, None,
+            lambda data: [self._compile_jhu_data(cp) for cp in data])
 
 
     async def jhu_county(self, state, county) -> JhuCsse:
@@ -612,6 +909,9 @@ class Covid:
         Get the data for a specific county within a US state.
         """
         endpoint = JHU_SINGLE_COUNTY.format(self.api_url, county)
+        miss_key = ('jhu_county', state.lower(), county.lower())
+
+        self.request_client.check_not_found(miss_key)
 
         all_matching_counties = await self.request_client.make_request(endpoint)
 
@@ -619,6 +919,7 @@ class Covid:
             matching_county = next(place for place in all_matching_counties if place["province"].lower() == state.lower()
             and place["county"].lower() == county.lower())
         except StopIteration:
+            self.request_client.add_not_found(miss_key, 'Nothing found for specified county.')
             raise NotFound('Nothing found for specified county.')
 
         return self._compile_jhu_data(matching_county)
@@ -630,9 +931,8 @@ class Covid:
         """
         endpoint = JHU_ALL_COUNTIES.format(self.api_url)
 
-        data = await self.request_client.make_request(endpoint)
-
-        return [self._compile_jhu_data(place) for place in data]
+        return await self._request_compiled('jhu_all_counties', endpoint, None,
+            lambda data: [self._compile_jhu_data(place) for place in data])
 
 
     async def all_continents(self, **kwargs) -> List[Continent]:
@@ -672,7 +972,7 @@ class Covid:
 
         data = await self.request_client.make_request(endpoint, params)
 
-        return [self._compile_continent(c) for c in data]
+        return [self._compile_continent(c, (yesterday, two_days_ago, allow_none)) for c in data]
 
 
     async def continent(self, continent, **kwargs) -> Continent:
@@ -683,7 +983,9 @@ class Covid:
         two_days_ago = kwargs.get('two_days_ago', False)
         allow_none = kwargs.get('allow_none', False)
 
-        endpoint = CONTINENT_DATA.format(self.api_url)
+        continent = self._resolve('continent', continent)
+
+        endpoint = CONTINENT_DATA.format(self.api_url, continent)
         params = None
 
         if yesterday:
@@ -702,7 +1004,7 @@ class Covid:
 
         data = await self.request_client.make_request(endpoint, params)
 
-        return self._compile_continent(data)
+        return self._compile_continent(data, (yesterday, allow_none))
 
 
     async def nyt(self) -> NewYorkTimesUsa:
@@ -738,11 +1040,8 @@ class Covid:
         Get the data for all states from New York Times
         """
         endpoint = NYT_ALL_STATES.format(self.api_url)
-        data = await self.request_client.make_request(endpoint)
-
-        states_list = self._compile_state_list(data)
 
-        return states_list
+        return await self._request_compiled('nyt_states', endpoint, None, self._compile_state_list)
 
 
     async def nyt_state(self, state) -> List[NewYorkTimesState]:
@@ -760,11 +1059,8 @@ class Covid:
         Get the data for all counties within all US states from NYT
         """
         endpoint = NYT_ALL_COUNTIES.format(self.api_url)
-        data = await self.request_client.make_request(endpoint)
 
-        county_list = self._compile_county_list(data)
-
-        return county_list
+        return await self._request_compiled('nyt_counties', endpoint, None, self._compile_county_list)
 
 
     async def nyt_county(self, county) -> NewYorkTimesCounty:
@@ -819,6 +1115,72 @@ class Covid:
         )
 
 
+    async def apple_mobility_table(self, country, subregion, **kwargs) -> MobilityTable:
+        """
+        Get the statistics for the specified subregion as a columnar table.
+
+        `types` selects which transport columns to keep (any of 'driving', 'transit' and 'walking'),
+        the others are left out of the table. Rows can be filtered while parsing with `get_types`
+        (values of `get_type`), `subregions` (values of `subregion_and_city`) and a `start`/`end` date window.
+        """
+        types = kwargs.get('types')
+        get_types = kwargs.get('get_types')
+        subregions = kwargs.get('subregions')
+        start = kwargs.get('start')
+        end = kwargs.get('end')
+
+        if isinstance(types, str):
+            types = [types]
+
+        if isinstance(get_types, str):
+            get_types = [get_types]
+
+        if isinstance(subregions, str):
+            subregions = [subregions]
+
+        types = set(types) if types else set(MOBILITY_TYPES)
+        unknown = types.difference(MOBILITY_TYPES)
+        if unknown:
+            raise ValueError('Unknown mobility types: {}. Choose from {}.'.format(', '.join(sorted(unknown)), ', '.join(MOBILITY_TYPES)))
+
+        get_types = set(get_types) if get_types else None
+        subregions = set(subregions) if subregions else None
+        start = _as_datetime(start).strftime('%Y-%m-%d') if isinstance(start, date) else start
+        end = _as_datetime(end).strftime('%Y-%m-%d') if isinstance(end, date) else end
+
+        endpoint = APPLE_SINGLE_SUBREGION.format(self.api_url, country, subregion)
+        data = await self.request_client.make_request(endpoint)
+
+        rows = [
+            row for row in data["data"]
+            if (get_types is None or row.get("get_type") in get_types)
+            and (subregions is None or row.get("subregion_and_city") in subregions)
+            and (start is None or (row.get("date") or '') >= start)
+            and (end is None or (row.get("date") or '') <= end)
+        ]
+
+        parsed = {}
+        for row in rows:
+            date_string = row.get("date")
+            if date_string and date_string not in parsed:
+                parsed[date_string] = datetime.strptime(date_string, "%Y-%m-%d")
+
+        columns = {
+            t: float_column(row.get(t) for row in rows) if t in types else None
+            for t in MOBILITY_TYPES
+        }
+
+        return MobilityTable(
+            data.get("subregion"),
+            [self._intern(row.get("subregion_and_city")) for row in rows],
+            [self._intern(row.get("get_type")) for row in rows],
+            [parsed.get(row.get("date")) for row in rows],
+            columns['driving'],
+            columns['transit'],
+            columns['walking']
+        )
+
+
     async def gov_countries(self) -> List[str]:
         """
         Get a list of countries supported by Governmental data
@@ -852,6 +1214,30 @@ class Covid:
         return data
 
 
+    async def gov_table(self, country, **kwargs) -> GovTable:
+        """
+        Get the data from the Government of a specified country as a typed, columnar table.
+
+        The layout of each country's data is learnt from its first response and reused afterwards.
+        It is learnt again only if a later response no longer fits it.
+        """
+        data = await self.gov(country, **kwargs)
+
+        key = str(country).lower()
+        schema = self._gov_schemas.get(key)
+
+        if schema is not None:
+            try:
+                return schema.compile(country, data)
+            except SchemaMismatch:
+                pass
+
+        schema = GovSchema.infer(data)
+        self._gov_schemas[key] = schema
+
+        return schema.compile(country, data)
+
+
     async def vaccine(self) -> Vaccines:
         """
         Get the data about vaccine trials for Covid.
@@ -880,15 +1266,17 @@ class Covid:
         """
         endpoint = COVERAGE_COUNTRIES.format(self.api_url)
         params = {'lastdays': last_days}
-        data = await self.request_client.make_request(endpoint, params=params)
 
-        return [self._compile_vax_country(country) for country in data]
+        return await self._request_compiled('vaccine_countries', endpoint, params,
+            lambda data: [self._compile_vax_country(country) for country in data])
 
 
     async def vaccine_country(self, country, last_days='all') -> VaccineCountry:
         """
         Get vaccination data for a specific country.
         """
+        country = self._resolve('country', country)
+
         endpoint = COVERAGE_COUNTRY.format(self.api_url, country)
         params = {'lastdays': last_days}
         data = await self.request_client.make_request(endpoint, params=params)
@@ -896,5 +1284,22 @@ class Covid:
         return self._compile_vax_country(data)
 
 
+    async def vaccine_matrix(self, last_days='all', countries=None) -> VaccineMatrix:
+        """
+        Get vaccination data for all countries as a matrix with a shared date axis.
+        Pass a list of `Country` as `countries` to enable lookups by ISO code and per capita figures.
+        """
+        endpoint = COVERAGE_COUNTRIES.format(self.api_url)
+        params = {'lastdays': last_days}
+        data = await self.request_client.make_request(endpoint, params=params)
+
+        matrix = self._compile_vax_matrix(data)
+
+        if countries:
+            matrix.add_info(countries)
+
+        return matrix
+
+
     async def therapeutics(self):
         raise NotImplementedError
\ No newline at end of file
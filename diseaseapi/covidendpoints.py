@@ -10,6 +10,7 @@ SINGLE_STATE = ALL_STATES + '/{}'
 
 HISTORICAL_COUNTRY = '{}' + _COVID_BASE + '/historical/{}'
 HISTORICAL_PROVINCE = HISTORICAL_COUNTRY + '/{}'
+MAX_URL_LENGTH = 2000
 STATE_COUNTY = '{}' + _COVID_BASE + '/historical/usacounties/{}'
 
 ALL_CONTINENTS = '{}' + _COVID_BASE + '/continents'
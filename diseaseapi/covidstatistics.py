@@ -1,3 +1,12 @@
+from array import array
+from bisect import bisect_left, bisect_right
+from collections.abc import Sequence
+from datetime import date, datetime
+from types import MappingProxyType
+from .columnar import diff
+from .exceptions import NotFound
+
+
 class Today:
     def __init__(self, cases, deaths, recoveries):
         self.cases = cases
@@ -98,11 +107,121 @@ class HistoryEntry:
         self.value = value
 
 
+class TimelineView(Sequence):
+    """
+    A read-only window onto a list of `HistoryEntry`, which does not copy the entries.
+    """
+    def __init__(self, entries, start=0, stop=None):
+        if isinstance(entries, TimelineView):
+            start += entries._start
+            stop = entries._stop if stop is None else entries._start + stop
+            entries = entries._entries
+
+        self._entries = entries
+        self._start = start
+        self._stop = len(entries) if stop is None else stop
+
+    def __len__(self):
+        return max(self._stop - self._start, 0)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            start, stop, step = i.indices(len(self))
+            if step != 1:
+                return [self[j] for j in range(start, stop, step)]
+            return TimelineView(self, start, max(start, stop))
+
+        if i < 0:
+            i += len(self)
+
+        if not 0 <= i < len(self):
+            raise IndexError('timeline index out of range')
+
+        return self._entries[self._start + i]
+
+    def __repr__(self):
+        return '<TimelineView {} entries>'.format(len(self))
+
+
+class HistoryDay:
+    def __init__(self, date, cases, deaths, recoveries):
+        self.date = date
+        self.cases = cases
+        self.deaths = deaths
+        self.recoveries = recoveries
+
+
+def _as_datetime(value):
+    if isinstance(value, date) and not isinstance(value, datetime):
+        return datetime(value.year, value.month, value.day)
+    return value
+
+
 class History:
     def __init__(self, cases, deaths, recoveries):
         self.cases = cases
         self.deaths = deaths
         self.recoveries = recoveries
+        self._dates = None
+
+    @property
+    def dates(self):
+        """
+        The sorted dates of the timeline, built once and used to find date windows by bisection.
+        """
+        if self._dates is None:
+            dates = [entry.date for entry in self.cases]
+
+            if any(a > b for a, b in zip(dates, dates[1:])):
+                order = sorted(range(len(dates)), key=dates.__getitem__)
+                self.cases = [self.cases[i] for i in order]
+                self.deaths = [self.deaths[i] for i in order]
+                if self.recoveries is not None:
+                    self.recoveries = [self.recoveries[i] for i in order]
+                dates = [dates[i] for i in order]
+
+            self._dates = dates
+
+        return self._dates
+
+    def _window(self, start, stop):
+        return History(
+            TimelineView(self.cases, start, stop),
+            TimelineView(self.deaths, start, stop),
+            TimelineView(self.recoveries, start, stop) if self.recoveries is not None else None
+        )
+
+    def between(self, start, end):
+        """
+        Get the entries from `start` to `end` inclusive, as views which do not copy the timeline.
+        """
+        dates = self.dates
+        return self._window(bisect_left(dates, _as_datetime(start)), bisect_right(dates, _as_datetime(end)))
+
+    def at(self, when):
+        """
+        Get the figures for a single date, or None if the timeline has no entry for it.
+        """
+        when = _as_datetime(when)
+        dates = self.dates
+        i = bisect_left(dates, when)
+
+        if i == len(dates) or dates[i] != when:
+            return None
+
+        return HistoryDay(
+            when,
+            self.cases[i].value,
+            self.deaths[i].value,
+            self.recoveries[i].value if self.recoveries is not None else None
+        )
+
+    def last(self, n):
+        """
+        Get the last `n` entries, as views which do not copy the timeline.
+        """
+        length = len(self.dates)
+        return self._window(max(length - n, 0), length)
 
 
 class Historical:
@@ -111,6 +230,24 @@ class Historical:
         self.province = province or None
         self.history = history
 
+    def between(self, start, end):
+        """
+        Get the data from `start` to `end` inclusive.
+        """
+        return Historical(self.name, self.province, self.history.between(start, end))
+
+    def at(self, when):
+        """
+        Get the figures for a single date, or None if there is no entry for it.
+        """
+        return self.history.at(when)
+
+    def last(self, n):
+        """
+        Get the data for the last `n` dates.
+        """
+        return Historical(self.name, self.province, self.history.last(n))
+
     
 class JhuCsse:
     def __init__(self, country, province, county, updated, confirmed_cases, deaths, recoveries, _lat, _long):
@@ -215,4 +352,216 @@ class VaccineTimeline:
 class VaccineCountry:
     def __init__(self, country, timeline):
         self.country = country
-        self.timeline = timeline
\ No newline at end of file
+        self.timeline = timeline
+
+class CountryMatrix:
+    """
+    Timelines of several countries on one shared date axis, stored as flat, row-major arrays
+    with one row per country and one column per date.
+    Countries can be looked up by name, or by ISO code once `add_info` has been given `Country` data.
+    """
+    def __init__(self, dates, countries):
+        self.dates = dates
+        self.countries = countries
+        self.populations = {}
+        self._index = {name.lower(): i for i, name in enumerate(countries)}
+        self._date_index = {date: i for i, date in enumerate(dates)}
+
+    def add_info(self, countries):
+        """
+        Register ISO codes and populations from a list of `Country`.
+        """
+        for country in countries:
+            i = self._index.get(country.name.lower())
+            if i is None:
+                continue
+
+            for code in (country.info.iso2, country.info.iso3):
+                if code:
+                    self._index.setdefault(code.lower(), i)
+
+            self.populations[i] = country.population
+
+    def index(self, country):
+        """
+        Get the row of a country from its name, ISO2 or ISO3 code.
+        """
+        try:
+            return self._index[country.lower()]
+        except KeyError:
+            raise NotFound('No data for {}.'.format(country))
+
+    def _row(self, values, country):
+        width = len(self.dates)
+        start = self.index(country) * width
+        return memoryview(values).toreadonly()[start:start + width]
+
+    def _column(self, values, date):
+        return values[self._date_index[date]::len(self.dates)]
+
+    def _per_population(self, values, country, scale):
+        population = self.populations.get(self.index(country))
+
+        if not population:
+            raise NotFound('No population data for {}.'.format(country))
+
+        factor = scale / population
+        return array('d', (value * factor for value in self._row(values, country)))
+
+
+class VaccineMatrix(CountryMatrix):
+    """
+    Vaccine coverage of several countries. `values` holds the doses given.
+    """
+    def __init__(self, dates, countries, values):
+        super().__init__(dates, countries)
+        self.values = values
+
+    def row(self, country):
+        """
+        Get the timeline of a country as a read-only view of the matrix, without copying it.
+        """
+        return self._row(self.values, country)
+
+    def column(self, date):
+        """
+        Get the doses of every country on a date, in the order of `countries`.
+        """
+        return self._column(self.values, date)
+
+    def latest(self):
+        """
+        Get the most recent number of doses for every country.
+        """
+        return dict(zip(self.countries, self.column(self.dates[-1]))) if self.dates else {}
+
+    def daily(self, country):
+        """
+        Get the number of doses given each day in a country.
+        """
+        return diff(self.row(country))
+
+    def per_hundred(self, country):
+        """
+        Get the doses per hundred people over time in a country.
+        Requires populations from `add_info`.
+        """
+        return self._per_population(self.values, country, 100.0)
+
+
+class HistoryMatrix(CountryMatrix):
+    """
+    Historical cases, deaths and recoveries of several countries.
+    Metrics are 'cases', 'deaths' and 'recovered'.
+    """
+    def __init__(self, dates, countries, cases, deaths, recovered):
+        super().__init__(dates, countries)
+        self.cases = cases
+        self.deaths = deaths
+        self.recovered = recovered
+
+    def row(self, country, metric='cases'):
+        """
+        Get the timeline of a metric for a country as a read-only view of the matrix, without copying it.
+        """
+        return self._row(getattr(self, metric), country)
+
+    def column(self, date, metric='cases'):
+        """
+        Get a metric for every country on a date, in the order of `countries`.
+        """
+        return self._column(getattr(self, metric), date)
+
+    def daily(self, country, metric='cases'):
+        """
+        Get the daily change of a metric in a country.
+        """
+        return diff(self.row(country, metric))
+
+    def per_million(self, country, metric='cases'):
+        """
+        Get a metric per million people over time in a country.
+        Requires populations from `add_info`.
+        """
+        return self._per_population(getattr(self, metric), country, 1000000.0)
+
+
+MOBILITY_TYPES = ('driving', 'transit', 'walking')
+
+
+class MobilityTable:
+    """
+    Columnar form of Apple's mobility data for a subregion, with row indexes by sub-region and by `get_type`.
+    Transport columns ('driving', 'transit', 'walking') which were not selected are None.
+    """
+    def __init__(self, subregion, names, types, dates, driving, transit, walking):
+        self.subregion = subregion
+        self.names = names
+        self.types = types
+        self.dates = dates
+        self.driving = driving
+        self.transit = transit
+        self.walking = walking
+        self.by_subregion = {}
+        self.by_type = {}
+
+        for i, (name, _type) in enumerate(zip(names, types)):
+            self.by_subregion.setdefault(name, []).append(i)
+            self.by_type.setdefault(_type, []).append(i)
+
+    def __len__(self):
+        return len(self.dates)
+
+    def rows(self, subregion=None, _type=None):
+        """
+        Get the row positions matching a sub-region and/or a `get_type` value.
+        """
+        if subregion is None and _type is None:
+            return list(range(len(self.dates)))
+
+        if _type is None:
+            return self.by_subregion.get(subregion, [])
+
+        if subregion is None:
+            return self.by_type.get(_type, [])
+
+        wanted = set(self.by_type.get(_type, []))
+        return [i for i in self.by_subregion.get(subregion, []) if i in wanted]
+
+    def series(self, column, subregion=None, _type=None):
+        """
+        Get the dates and values of a column ('driving', 'transit' or 'walking') for a sub-region and/or a `get_type` value.
+        """
+        if column not in MOBILITY_TYPES:
+            raise ValueError('column should be one of {}.'.format(', '.join(MOBILITY_TYPES)))
+
+        values = getattr(self, column)
+        if values is None:
+            raise ValueError('The {} column was not selected for this table.'.format(column))
+
+        rows = self.rows(subregion, _type)
+
+        return [self.dates[i] for i in rows], array('d', (values[i] for i in rows))
+
+
+class Snapshot:
+    """
+    Several aggregates fetched together. Parts that were not requested are None.
+
+    `fetched` is the time the fetch started and `updated` maps each part to its upstream update time.
+    Snapshots are read-only.
+    """
+    __slots__ = ('fetched', 'global_data', 'countries', 'continents', 'states', 'vaccine_coverage', 'updated')
+
+    def __init__(self, fetched, updated, **parts):
+        for name in self.__slots__:
+            object.__setattr__(self, name, parts.get(name))
+
+        object.__setattr__(self, 'fetched', fetched)
+        object.__setattr__(self, 'updated', MappingProxyType(dict(updated)))
+
+    def __setattr__(self, name, value):
+        raise AttributeError('Snapshot is read-only.')
+
+    def __delattr__(self, name):
+        raise AttributeError('Snapshot is read-only.')
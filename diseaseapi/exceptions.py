@@ -1,6 +1,9 @@
 class APIError(Exception):
     pass
 
+class ServerError(APIError):
+    pass
+
 class NotFound(Exception):
     pass
 
@@ -0,0 +1,241 @@
+import codecs
+import csv
+import json
+from .covidendpoints import NYT_ALL_COUNTIES, JHU_ALL_COUNTIES, COVERAGE_COUNTRIES, APPLE_SINGLE_SUBREGION
+
+FORMATS = ('csv', 'ndjson', 'parquet')
+
+_SEPARATORS = ' \t\r\n,'
+_DELIMITERS = _SEPARATORS + ']'
+
+
+def _get(item, path):
+    for key in path:
+        if not isinstance(item, dict):
+            return None
+        item = item.get(key)
+    return item
+
+
+def _plain_rows(columns):
+    paths = [(name, tuple(name.split('.'))) for name in columns]
+
+    def rows(item):
+        yield {name: _get(item, path) for name, path in paths}
+
+    return rows
+
+
+def _vaccine_rows(item):
+    country = item.get('country')
+    for date, value in (item.get('timeline') or {}).items():
+        yield {'country': country, 'date': date, 'value': value}
+
+
+class Dataset:
+    def __init__(self, endpoint, columns, types=None, rows=None, key=None, params=None):
+        self.endpoint = endpoint
+        self.columns = columns
+        self.types = {c: (types or {}).get(c, str) for c in columns}
+        self.rows = rows or _plain_rows(columns)
+        self.key = key
+        self.params = params or ()
+
+
+DATASETS = {
+    'nyt_counties': Dataset(
+        NYT_ALL_COUNTIES,
+        ['date', 'county', 'state', 'fips', 'cases', 'deaths'],
+        {'cases': int, 'deaths': int}
+    ),
+    'jhu_all_counties': Dataset(
+        JHU_ALL_COUNTIES,
+        ['country', 'province', 'county', 'updatedAt', 'stats.confirmed', 'stats.deaths', 'stats.recovered',
+         'coordinates.latitude', 'coordinates.longitude'],
+        {'stats.confirmed': int, 'stats.deaths': int, 'stats.recovered': int,
+         'coordinates.latitude': float, 'coordinates.longitude': float}
+    ),
+    'vaccine_countries': Dataset(
+        COVERAGE_COUNTRIES,
+        ['country', 'date', 'value'],
+        {'value': int},
+        rows=_vaccine_rows,
+        params=('lastdays',)
+    ),
+    'apple_mobility_data': Dataset(
+        APPLE_SINGLE_SUBREGION,
+        ['subregion_and_city', 'get_type', 'date', 'driving', 'transit', 'walking'],
+        {'driving': float, 'transit': float, 'walking': float},
+        key='data'
+    ),
+}
+
+
+async def iter_json_array(chunks, key=None):
+    """
+    Decode the items of a JSON array one at a time from an asynchronous iterator of byte chunks.
+    The array is either the whole document or, if `key` is given, the first value of that key.
+    Only one item is held in memory at a time.
+    """
+    decoder = json.JSONDecoder()
+    text = codecs.getincrementaldecoder('utf-8')()
+    buffer = ''
+    pos = 0
+    started = False
+    marker = '"{}"'.format(key) if key else None
+
+    async for chunk in chunks:
+        buffer = buffer[pos:] + text.decode(chunk)
+        pos = 0
+
+        if not started:
+            if marker:
+                at = buffer.find(marker)
+                if at < 0:
+                    pos = max(len(buffer) - len(marker), 0)
+                    continue
+                bracket = buffer.find('[', at + len(marker))
+            else:
+                bracket = buffer.find('[')
+
+            if bracket < 0:
+                continue
+
+            started = True
+            pos = bracket + 1
+
+        while True:
+            while pos < len(buffer) and buffer[pos] in _SEPARATORS:
+                pos += 1
+
+            if pos < len(buffer) and buffer[pos] == ']':
+                return
+
+            try:
+                item, end = decoder.raw_decode(buffer, pos)
+            except ValueError:
+                break #the item continues in the next chunk
+
+            if not isinstance(item, (dict, list, str)) and (end == len(buffer) or buffer[end] not in _DELIMITERS):
+                break #a number might continue in the next chunk
+
+            pos = end
+            yield item
+
+    raise ValueError('The response ended before the end of the JSON array.')
+
+
+_ARROW_TYPES = {
+    str: lambda pa: pa.string(),
+    int: lambda pa: pa.int64(),
+    float: lambda pa: pa.float64(),
+}
+
+
+class _CsvWriter:
+    def __init__(self, path, columns, types, row_group_size):
+        self.f = open(path, 'w', newline='', encoding='utf-8')
+        self.columns = columns
+        self.writer = csv.writer(self.f)
+        self.writer.writerow(columns)
+
+    def write(self, row):
+        self.writer.writerow([row.get(c) for c in self.columns])
+
+    def close(self):
+        self.f.close()
+
+
+class _NdjsonWriter:
+    def __init__(self, path, columns, types, row_group_size):
+        self.f = open(path, 'w', encoding='utf-8')
+
+    def write(self, row):
+        self.f.write(json.dumps(row))
+        self.f.write('\n')
+
+    def close(self):
+        self.f.close()
+
+
+class _ParquetWriter:
+    def __init__(self, path, columns, types, row_group_size):
+        try:
+            import pyarrow
+            import pyarrow.parquet
+        except ImportError:
+            raise ImportError('Exporting to Parquet requires pyarrow (`python3 -m pip install -U pyarrow`).')
+
+        self.pa = pyarrow
+        self.columns = columns
+        self.types = types
+        self.row_group_size = row_group_size
+        self.batch = []
+        self.schema = pyarrow.schema([(c, _ARROW_TYPES[types[c]](pyarrow)) for c in columns])
+        self.writer = pyarrow.parquet.ParquetWriter(path, self.schema)
+
+    def write(self, row):
+        self.batch.append(row)
+        if len(self.batch) >= self.row_group_size:
+            self._flush()
+
+    def _flush(self):
+        if not self.batch:
+            return
+
+        columns = []
+        for c in self.columns:
+            convert = self.types[c]
+            columns.append([None if row.get(c) is None else convert(row[c]) for row in self.batch])
+
+        self.writer.write_table(self.pa.Table.from_arrays(columns, schema=self.schema))
+        self.batch = []
+
+    def close(self):
+        self._flush()
+        self.writer.close()
+
+
+_WRITERS = {
+    'csv': _CsvWriter,
+    'ndjson': _NdjsonWriter,
+    'parquet': _ParquetWriter,
+}
+
+
+async def export(client, dataset, path, *args, fmt=None, last_days='all', row_group_size=100000):
+    """
+    Stream a large dataset straight from the API to a CSV, NDJSON or Parquet file without building any models.
+    Memory use stays bounded by `row_group_size` rows (Parquet) or a single item (CSV and NDJSON).
+
+    `dataset` is one of 'nyt_counties', 'jhu_all_counties', 'vaccine_countries' and 'apple_mobility_data'.
+    Extra arguments fill in the endpoint, e.g. the country and subregion for apple_mobility_data,
+    and `last_days` is passed on for vaccine_countries. `fmt` is guessed from the file extension if not given.
+    Returns the number of rows written.
+    """
+    if dataset not in DATASETS:
+        raise ValueError('Unknown dataset: {}. Choose from {}.'.format(dataset, ', '.join(DATASETS)))
+
+    spec = DATASETS[dataset]
+    fmt = (fmt or path.rsplit('.', 1)[-1]).lower()
+    fmt = 'ndjson' if fmt in ('json', 'jsonl') else fmt
+
+    if fmt not in FORMATS:
+        raise ValueError('Unknown format: {}. Choose from {}.'.format(fmt, ', '.join(FORMATS)))
+
+    params = {'lastdays': last_days} if 'lastdays' in spec.params else None
+    endpoint = spec.endpoint.format(client.base_url, *args)
+    chunks = client.request_client.stream(endpoint, params)
+
+    writer = _WRITERS[fmt](path, spec.columns, spec.types, row_group_size)
+    count = 0
+
+    try:
+        async for item in iter_json_array(chunks, spec.key):
+            for row in spec.rows(item):
+                writer.write(row)
+                count += 1
+    finally:
+        writer.close()
+
+    return count
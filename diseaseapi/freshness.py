@@ -0,0 +1,92 @@
+import time
+from datetime import datetime, timezone
+
+MINUTE = 60
+HOUR = 60 * MINUTE
+DAY = 24 * HOUR
+WEEK = 7 * DAY
+
+
+class FreshnessPolicy:
+    """
+    Decides how long a response can be served from the cache.
+
+    Each upstream source refreshes at its own cadence. The next refresh of a resource is
+    its `updated` stamp plus the cadence of its source. If that time has already passed,
+    the upstream is late and the resource is checked again after `retry` seconds.
+    """
+    DEFAULT_CADENCES = [
+        ('/influenza/', WEEK),
+        ('/covid-19/vaccine/coverage', DAY),
+        ('/covid-19/vaccine', WEEK),
+        ('/covid-19/nyt/', DAY),
+        ('/covid-19/apple/', DAY),
+        ('/covid-19/historical', HOUR),
+        ('/covid-19/jhucsse', HOUR),
+        ('/covid-19/gov', HOUR),
+        ('/covid-19/', 10 * MINUTE)
+    ]
+
+    def __init__(self, cadences=None, default=10 * MINUTE, retry=MINUTE):
+        self.cadences = list(cadences or []) + self.DEFAULT_CADENCES
+        self.default = default
+        self.retry = retry
+
+    def cadence(self, endpoint):
+        """
+        Get the refresh interval in seconds of the source behind an endpoint.
+        """
+        for fragment, interval in self.cadences:
+            if fragment in endpoint:
+                return interval
+
+        return self.default
+
+    def next_refresh(self, endpoint, data, now=None):
+        """
+        Get the UNIX timestamp after which `data`, fetched from `endpoint`, should be requested again.
+        """
+        now = time.time() if now is None else now
+        interval = self.cadence(endpoint)
+        updated = updated_stamp(data)
+
+        if updated is None:
+            return now + interval
+
+        due = updated + interval
+
+        if due <= now:
+            return now + min(self.retry, interval)
+
+        return min(due, now + interval)
+
+
+def updated_stamp(data):
+    """
+    Get the most recent upstream update time of a response as a UNIX timestamp, or None if it has none.
+    """
+    if isinstance(data, dict):
+        return _item_stamp(data)
+
+    if isinstance(data, list):
+        stamps = [_item_stamp(item) for item in data if isinstance(item, dict)]
+        stamps = [s for s in stamps if s is not None]
+        return max(stamps) if stamps else None
+
+    return None
+
+
+def _item_stamp(item):
+    updated = item.get('updated')
+    if isinstance(updated, (int, float)):
+        return updated / 1000.0
+
+    updated_at = item.get('updatedAt')
+    if isinstance(updated_at, str):
+        try:
+            dt = datetime.strptime(updated_at, '%Y-%m-%d %H:%M:%S')
+        except ValueError:
+            return None
+        return dt.replace(tzinfo=timezone.utc).timestamp()
+
+    return None
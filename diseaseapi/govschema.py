@@ -0,0 +1,170 @@
+from array import array
+from .columnar import NAN
+
+
+def _rows(data):
+    if isinstance(data, list):
+        return [row for row in data if isinstance(row, dict)]
+
+    if isinstance(data, dict):
+        return [data]
+
+    return []
+
+
+def _flatten(row, prefix, out):
+    for key, value in row.items():
+        path = prefix + (key,)
+        if isinstance(value, dict) and value:
+            _flatten(value, path, out)
+        else:
+            out[path] = value
+
+
+def _shapes(row, prefix, out):
+    out.setdefault(prefix, set()).update(row)
+    for key, value in row.items():
+        if isinstance(value, dict) and value:
+            _shapes(value, prefix + (key,), out)
+
+
+def _fits(row, prefix, shapes):
+    known = shapes.get(prefix)
+    if known is None or row.keys() - known:
+        return False
+
+    for key, value in row.items():
+        if isinstance(value, dict) and value and not _fits(value, prefix + (key,), shapes):
+            return False
+
+    return True
+
+
+def _kind(values):
+    kinds = set()
+
+    for value in values:
+        if value is None:
+            kinds.add('none')
+        elif isinstance(value, bool):
+            return 'object'
+        elif isinstance(value, int):
+            kinds.add('int')
+        elif isinstance(value, float):
+            kinds.add('float')
+        else:
+            return 'object'
+
+    if kinds == {'int'}:
+        return 'int'
+
+    if kinds and kinds <= {'int', 'float', 'none'} and kinds != {'none'}:
+        return 'float'
+
+    return 'object'
+
+
+def _getter(path):
+    if len(path) == 1:
+        key = path[0]
+        return lambda row: row.get(key)
+
+    def get(row):
+        for key in path:
+            row = row.get(key)
+            if row is None:
+                return None
+        return row
+
+    return get
+
+
+class SchemaMismatch(Exception):
+    pass
+
+
+class GovTable:
+    """
+    Typed, columnar form of the data from a country's government website.
+    Columns are named after the path to the field, joined with dots, e.g. 'cases.total'.
+    """
+    def __init__(self, country, columns):
+        self.country = country
+        self.columns = columns
+
+    def __len__(self):
+        return len(next(iter(self.columns.values()))) if self.columns else 0
+
+    def __getitem__(self, field):
+        return self.columns[field]
+
+    def __contains__(self, field):
+        return field in self.columns
+
+    @property
+    def fields(self):
+        return list(self.columns)
+
+    def row(self, i):
+        """
+        Get a single row as a flat dict.
+        """
+        return {name: column[i] for name, column in self.columns.items()}
+
+
+class GovSchema:
+    """
+    The field layout of a country's government data, learnt from a response.
+    `shapes` maps the path of every nested object to the keys seen in it.
+    """
+    def __init__(self, fields, shapes):
+        self.fields = fields
+        self.shapes = shapes
+        self._getters = [(path, kind, _getter(path)) for path, kind in fields]
+
+    @classmethod
+    def infer(cls, data):
+        rows = _rows(data)
+        values = {}
+        shapes = {(): set()}
+
+        for row in rows:
+            _shapes(row, (), shapes)
+            flat = {}
+            _flatten(row, (), flat)
+            for path, value in flat.items():
+                values.setdefault(path, []).append(value)
+
+        fields = []
+        for path, seen in values.items():
+            if len(seen) < len(rows):
+                seen.append(None)
+            fields.append((path, _kind(seen)))
+
+        return cls(fields, {path: frozenset(keys) for path, keys in shapes.items()})
+
+    def compile(self, country, data):
+        """
+        Build a `GovTable` from a response. Raises SchemaMismatch if the response does not fit this schema.
+        """
+        rows = _rows(data)
+
+        for row in rows:
+            if not _fits(row, (), self.shapes):
+                raise SchemaMismatch()
+
+        columns = {}
+
+        try:
+            for path, kind, get in self._getters:
+                name = '.'.join(path)
+                if kind == 'int':
+                    columns[name] = array('q', [get(row) for row in rows])
+                elif kind == 'float':
+                    columns[name] = array('d', [NAN if v is None else v for v in map(get, rows)])
+                else:
+                    columns[name] = [get(row) for row in rows]
+        except (TypeError, AttributeError, OverflowError):
+            raise SchemaMismatch()
+
+        return GovTable(country, columns)
@@ -0,0 +1,90 @@
+import asyncio
+from collections import deque
+
+
+class HedgePolicy:
+    """
+    Issues a second, identical GET when the first has not returned in time, and uses whichever answers first.
+
+    The delay is `delay` seconds if given, otherwise the `percentile` of recently observed latencies
+    (once `min_samples` have been observed). At most `budget` extra requests are made per request sent,
+    e.g. 0.05 allows one hedge per twenty requests.
+    """
+    def __init__(self, delay=None, percentile=0.95, budget=0.05, min_samples=20, window=256):
+        self.delay = delay
+        self.percentile = percentile
+        self.budget = budget
+        self.min_samples = min_samples
+        self.latencies = deque(maxlen=window)
+        self.requests = 0
+        self.fired = 0
+        self.won = 0
+
+    def observe(self, latency):
+        self.latencies.append(latency)
+
+    def current_delay(self):
+        """
+        Get the delay after which a request is hedged, or None if not enough latencies have been observed yet.
+        """
+        if self.delay is not None:
+            return self.delay
+
+        if len(self.latencies) < self.min_samples:
+            return None
+
+        ordered = sorted(self.latencies)
+        return ordered[min(int(len(ordered) * self.percentile), len(ordered) - 1)]
+
+    def can_hedge(self):
+        return self.fired < self.budget * self.requests
+
+    async def run(self, request):
+        """
+        Run `request`, a function returning a new coroutine for the same GET, hedging it if it is slow.
+        """
+        self.requests += 1
+        loop = asyncio.get_event_loop()
+        start = loop.time()
+        primary = asyncio.ensure_future(request())
+        hedge = None
+
+        try:
+            delay = self.current_delay()
+
+            if delay is not None:
+                done, _ = await asyncio.wait([primary], timeout=delay)
+
+                if not done and self.can_hedge():
+                    self.fired += 1
+                    hedge = asyncio.ensure_future(request())
+
+            if hedge is None:
+                result = await primary
+                self.observe(loop.time() - start)
+                return result
+
+            pending = {primary, hedge}
+            error = None
+
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+
+                for task in done:
+                    if task.exception() is None:
+                        if task is hedge:
+                            self.won += 1
+                        self.observe(loop.time() - start)
+                        return task.result()
+
+                    if error is None:
+                        error = task.exception()
+
+            raise error
+        finally:
+            for task in (primary, hedge):
+                if task is not None and not task.done():
+                    task.cancel()
+
+    def stats(self):
+        return {'requests': self.requests, 'fired': self.fired, 'won': self.won}
@@ -1,6 +1,7 @@
 from datetime import datetime, timezone
 from .influenzastatistics import *
 from .influenzaendpoints import *
+from .columnar import int_column, float_column
 
 
 class Influenza:
@@ -116,4 +117,82 @@ class Influenza:
             updated,
             source,
             weeks
-        )
\ No newline at end of file
+        )
+
+
+    async def ilinet_table(self) -> ILINetTable:
+        """
+        Get the ILINet data as a week indexed table of typed columns
+        """
+        endpoint = FLU_ILINET.format(self.api_url)
+
+        data = await self.request_client.make_request(endpoint)
+        rows = data["data"]
+
+        return ILINetTable(
+            datetime.utcfromtimestamp(data.get('updated')/1000),
+            data.get('source'),
+            [item["week"] for item in rows],
+            {
+                "age_0_4": int_column(item["age 0-4"] for item in rows),
+                "age_5_24": int_column(item["age 5-24"] for item in rows),
+                "age_25_49": int_column(item["age 25-49"] for item in rows),
+                "age_50_64": int_column(item["age 50-64"] for item in rows),
+                "age_64_plus": int_column(item["age 64+"] for item in rows),
+                "total_ili": int_column(item["totalILI"] for item in rows),
+                "total_patients": int_column(item["totalPatients"] for item in rows),
+                "weighted": float_column(item["percentWeightedILI"] for item in rows),
+                "unweighted": float_column(item["percentUnweightedILI"] for item in rows)
+            }
+        )
+
+
+    async def uscl_table(self) -> USCLTable:
+        """
+        Get the US clinical lab data as a week indexed table of typed columns
+        """
+        endpoint = FLU_USCL.format(self.api_url)
+
+        data = await self.request_client.make_request(endpoint)
+        rows = data["data"]
+
+        return USCLTable(
+            datetime.utcfromtimestamp(data.get('updated')/1000),
+            data.get('source'),
+            [item["week"] for item in rows],
+            {
+                "type_a": int_column(item["totalA"] for item in rows),
+                "type_b": int_column(item["totalB"] for item in rows),
+                "tests": int_column(item["totalTests"] for item in rows),
+                "positive_a": float_column(item["percentPositiveA"] for item in rows),
+                "positive_b": float_column(item["percentPositiveB"] for item in rows),
+                "positive": float_column(item["percentPositive"] for item in rows)
+            }
+        )
+
+
+    async def usphl_table(self) -> USPHLTable:
+        """
+        Get the US public health lab data as a week indexed table of typed columns
+        """
+        endpoint = FLU_USPHL.format(self.api_url)
+
+        data = await self.request_client.make_request(endpoint)
+        rows = data["data"]
+
+        return USPHLTable(
+            datetime.utcfromtimestamp(data.get('updated')/1000),
+            data.get('source'),
+            [item["week"] for item in rows],
+            {
+                "h3n2v": int_column(item["A(H3N2v)"] for item in rows),
+                "h1n1": int_column(item["A(H1N1)"] for item in rows),
+                "h3": int_column(item["A(H3)"] for item in rows),
+                "unable_to_subtype": int_column(item["A(unable to sub-type)"] for item in rows),
+                "subtyping_not_performed": int_column(item["A(Subtyping not performed)"] for item in rows),
+                "type_b": int_column(item["B"] for item in rows),
+                "bvic": int_column(item["BVIC"] for item in rows),
+                "byam": int_column(item["BYAM"] for item in rows),
+                "total_tests": int_column(item["totalTests"] for item in rows)
+            }
+        )
@@ -1,3 +1,6 @@
+from .columnar import group_sum, rolling_mean, rolling_sum
+
+
 class ILIPercent:
     def __init__(self, weighted, unweighted):
         self.weighted = weighted
@@ -70,4 +73,90 @@ class USPHL:
     def __init__(self, updated, source, data):
         self.updated = updated
         self.source = source
-        self.stats = data
\ No newline at end of file
+        self.stats = data
+
+class WeekTable:
+    """
+    Columnar, week indexed form of a CDC report. Every metric is a typed array with one value per week.
+    """
+    def __init__(self, updated, source, weeks, columns):
+        self.updated = updated
+        self.source = source
+        self.weeks = weeks
+        self.week_index = {week: i for i, week in enumerate(weeks)}
+        self.columns = columns
+        self._seasons = None
+
+        for name, column in columns.items():
+            setattr(self, name, column)
+
+    def __len__(self):
+        return len(self.weeks)
+
+    def row(self, week):
+        """
+        Get every metric for a single week as a dict.
+        """
+        i = self.week_index[week]
+        return {name: column[i] for name, column in self.columns.items()}
+
+    def seasons(self):
+        """
+        Map each influenza season (e.g. '2019-20') to the row positions of its weeks.
+        """
+        if self._seasons is None:
+            seasons = {}
+            for i, week in enumerate(self.weeks):
+                seasons.setdefault(season_of(week), []).append(i)
+            self._seasons = seasons
+
+        return self._seasons
+
+    def season_totals(self, column):
+        """
+        Total of a metric for each influenza season.
+        """
+        return group_sum(self.columns[column], self.seasons())
+
+    def rolling_mean(self, column, window):
+        """
+        Rolling mean of a metric over `window` weeks.
+        """
+        return rolling_mean(self.columns[column], window)
+
+    def rolling_sum(self, column, window):
+        """
+        Rolling total of a metric over `window` weeks.
+        """
+        return rolling_sum(self.columns[column], window)
+
+
+class ILINetTable(WeekTable):
+    pass
+
+
+class USCLTable(WeekTable):
+    pass
+
+
+class USPHLTable(WeekTable):
+    pass
+
+
+def season_of(week):
+    """
+    Get the influenza season a CDC week belongs to. Seasons start on week 40, so '2019-45' and '2020-10' are both '2019-20'.
+    Returns None if the week could not be understood.
+    """
+    digits = ''.join(c for c in str(week) if c.isdigit())
+
+    if len(digits) < 5:
+        return None
+
+    year = int(digits[:4])
+    number = int(digits[4:])
+
+    if number < 40:
+        year -= 1
+
+    return '{}-{:02d}'.format(year, (year + 1) % 100)
@@ -0,0 +1,68 @@
+import time
+
+
+class Mirror:
+    def __init__(self, url):
+        self.url = url.rstrip('/')
+        self.latency = None
+        self.failures = 0
+        self.down_until = 0.0
+
+    @property
+    def healthy(self):
+        return self.down_until <= time.monotonic()
+
+
+class MirrorPool:
+    """
+    Several base URLs serving the same API.
+
+    Requests go to the healthy mirror with the lowest latency, tracked as an exponentially weighted moving average.
+    A mirror which fails is skipped for `cooldown` seconds, doubling for each consecutive failure up to `max_cooldown`.
+    Mirrors which have not been measured yet are tried first so that every mirror gets a latency.
+    """
+    def __init__(self, urls, alpha=0.3, cooldown=5, max_cooldown=300):
+        if not urls:
+            raise ValueError('At least one base URL is required.')
+
+        self.mirrors = [Mirror(url) for url in urls]
+        self.primary = self.mirrors[0].url
+        self.alpha = alpha
+        self.cooldown = cooldown
+        self.max_cooldown = max_cooldown
+
+    def path(self, endpoint):
+        """
+        Get the part of an endpoint built from the primary base URL which follows the base URL.
+        """
+        if not endpoint.startswith(self.primary):
+            raise ValueError('{} is not an endpoint of {}.'.format(endpoint, self.primary))
+
+        return endpoint[len(self.primary):]
+
+    def ordered(self):
+        """
+        Get the mirrors in the order they should be tried.
+        Unhealthy mirrors come last, so they are still tried if every other mirror fails.
+        """
+        healthy = [m for m in self.mirrors if m.healthy]
+        unhealthy = [m for m in self.mirrors if not m.healthy]
+
+        healthy.sort(key=lambda m: -1.0 if m.latency is None else m.latency)
+        unhealthy.sort(key=lambda m: m.down_until)
+
+        return healthy + unhealthy
+
+    def success(self, mirror, latency):
+        mirror.failures = 0
+        mirror.down_until = 0.0
+
+        if mirror.latency is None:
+            mirror.latency = latency
+        else:
+            mirror.latency += self.alpha * (latency - mirror.latency)
+
+    def failure(self, mirror):
+        mirror.failures += 1
+        cooldown = min(self.cooldown * 2 ** (mirror.failures - 1), self.max_cooldown)
+        mirror.down_until = time.monotonic() + cooldown
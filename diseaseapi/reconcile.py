@@ -0,0 +1,156 @@
+from .exceptions import NotFound
+from .resolver import normalize
+
+_COUNTY_SUFFIXES = (' county', ' parish', ' borough', ' census area', ' municipality')
+
+
+def county_key(state, county):
+    """
+    Normalised (state, county) key used to match county names across sources,
+    e.g. ('New York', 'Kings County') and ('new york', 'kings') give the same key.
+    """
+    county = normalize(county)
+    for suffix in _COUNTY_SUFFIXES:
+        if county.endswith(suffix):
+            county = county[:-len(suffix)]
+            break
+    return normalize(state), county
+
+
+def _latest(index, key, entry):
+    current = index.get(key)
+    if current is None or (entry.date is not None and (current.date is None or entry.date > current.date)):
+        index[key] = entry
+
+
+class CountyRecord:
+    def __init__(self, fips, state, county, nyt, jhu):
+        self.fips = fips
+        self.state = state
+        self.county = county
+        self.nyt = nyt
+        self.jhu = jhu
+
+
+class StateRecord:
+    def __init__(self, fips, state, nyt, worldometers, jhu_counties):
+        self.fips = fips
+        self.state = state
+        self.nyt = nyt
+        self.worldometers = worldometers
+        self.jhu_counties = jhu_counties
+
+    @property
+    def jhu_confirmed(self):
+        return sum(c.confirmed_cases or 0 for c in self.jhu_counties)
+
+    @property
+    def jhu_deaths(self):
+        return sum(c.deaths or 0 for c in self.jhu_counties)
+
+
+class Reconciler:
+    """
+    Joins New York Times, JHU CSSE and Worldometers (`State`) data on FIPS codes and normalised names.
+    Every source is indexed once, so each join is a single pass of dictionary lookups.
+
+    Only the most recent NYT entry of each county and state is kept.
+    """
+    def __init__(self, nyt_counties=(), jhu_counties=(), states=(), nyt_states=()):
+        self.nyt_counties = {}
+        self.nyt_county_fips = {}
+        for entry in nyt_counties:
+            _latest(self.nyt_counties, county_key(entry.state, entry.county), entry)
+
+        for key, entry in self.nyt_counties.items():
+            if entry.fips is not None:
+                self.nyt_county_fips[entry.fips] = key
+
+        self.jhu_counties = {}
+        self.jhu_states = {}
+        for county in jhu_counties:
+            if county.country_name not in (None, 'US'):
+                continue
+            key = county_key(county.province_name, county.county_name)
+            self.jhu_counties[key] = county
+            self.jhu_states.setdefault(key[0], []).append(county)
+
+        self.states = {normalize(state.name): state for state in states}
+
+        self.nyt_states = {}
+        self.nyt_state_fips = {}
+        for entry in nyt_states:
+            _latest(self.nyt_states, normalize(entry.state), entry)
+
+        for key, entry in self.nyt_states.items():
+            if entry.fips is not None:
+                self.nyt_state_fips[entry.fips] = key
+
+    def _county_record(self, key):
+        nyt = self.nyt_counties.get(key)
+        jhu = self.jhu_counties.get(key)
+
+        if nyt is not None:
+            return CountyRecord(nyt.fips, nyt.state, nyt.county, nyt, jhu)
+        if jhu is not None:
+            return CountyRecord(None, jhu.province_name, jhu.county_name, None, jhu)
+        raise NotFound('No data for county {} in {}.'.format(key[1], key[0]))
+
+    def _state_record(self, key):
+        nyt = self.nyt_states.get(key)
+        worldometers = self.states.get(key)
+        jhu = self.jhu_states.get(key, [])
+
+        if nyt is not None:
+            name = nyt.state
+        elif worldometers is not None:
+            name = worldometers.name
+        elif jhu:
+            name = jhu[0].province_name
+        else:
+            raise NotFound('No data for state {}.'.format(key))
+
+        return StateRecord(nyt.fips if nyt else None, name, nyt, worldometers, jhu)
+
+    def county_table(self):
+        """
+        One `CountyRecord` per county found in either NYT or JHU data.
+        """
+        keys = list(self.nyt_counties)
+        keys += [k for k in self.jhu_counties if k not in self.nyt_counties]
+        return [self._county_record(key) for key in keys]
+
+    def state_table(self):
+        """
+        One `StateRecord` per state found in NYT, Worldometers or JHU data. JHU data is per county,
+        so every JHU county of the state is attached.
+        """
+        keys = list(self.nyt_states)
+        keys += [k for k in self.states if k not in self.nyt_states]
+        keys += [k for k in self.jhu_states if k not in self.nyt_states and k not in self.states]
+        return [self._state_record(key) for key in keys]
+
+    def county(self, fips=None, state=None, county=None) -> CountyRecord:
+        """
+        Look up a single county by FIPS code or by state and county name.
+        Raises NotFound if no source has it.
+        """
+        if fips is None:
+            return self._county_record(county_key(state, county))
+
+        if int(fips) not in self.nyt_county_fips:
+            raise NotFound('No county with FIPS code {}.'.format(fips))
+
+        return self._county_record(self.nyt_county_fips[int(fips)])
+
+    def state(self, name=None, fips=None) -> StateRecord:
+        """
+        Look up a single state by name or FIPS code. Raises NotFound if no source has it.
+        """
+        if fips is None:
+            return self._state_record(normalize(name))
+
+        if int(fips) not in self.nyt_state_fips:
+            raise NotFound('No state with FIPS code {}.'.format(fips))
+
+        return self._state_record(self.nyt_state_fips[int(fips)])
@@ -1,23 +1,211 @@
+import asyncio
+import contextlib
+import hashlib
+import json
+import time
 import aiohttp
-from .exceptions import NotFound, APIError
+from .cache import LRUStore, ModelCache, NegativeCache, ResponseCache, cache_key
+from .exceptions import NotFound, APIError, ServerError
+from .scheduler import NORMAL, PriorityScheduler, PriorityView
 
 ver = '1.2.0'
 
 class RequestClient:
-    def __init__(self):
+    def __init__(self, freshness_policy=None, negative_cache_ttl=30, memory_budget=None, hedge_policy=None,
+                mirrors=None, max_concurrency=None):
         self.session = aiohttp.ClientSession(headers={
             "User-Agent": "apex2504/disease.py v{}".format(ver)
         })
+        self.freshness_policy = freshness_policy
+        self.store = LRUStore(memory_budget)
+        self.cache = ResponseCache(self.store) if freshness_policy else None
+        self.models = ModelCache(self.store) if memory_budget else None
+        self.negative_cache = NegativeCache(negative_cache_ttl) if negative_cache_ttl else None
+        self.hedge_policy = hedge_policy
+        self.mirrors = mirrors
+        self.scheduler = PriorityScheduler(max_concurrency) if max_concurrency else None
 
-    async def make_request(self, endpoint, params=None):
-        async with self.session.get(endpoint, params=params) as resp:
+    async def make_request(self, endpoint, params=None, priority=NORMAL):
+        data, _ = await self.fetch(endpoint, params, priority)
+        return data
+
+
+    def with_priority(self, priority):
+        """
+        Get a view of this client which makes its requests with the given priority.
+        """
+        return PriorityView(self, priority)
+
+
+    async def fetch(self, endpoint, params=None, priority=NORMAL):
+        """
+        Like make_request, but also returns a fingerprint of the response body which
+        is the same whenever the upstream data is unchanged. The fingerprint is only computed
+        when the client has a memory budget (and so a model cache), otherwise it is None.
+        """
+        key = cache_key(endpoint, params)
+        self.check_not_found(key)
+
+        if self.cache is not None:
+            entry = self.cache.get(key)
+
+            if entry is not None:
+                return entry.data, entry.fingerprint
+
+        try:
+            if self.hedge_policy is None:
+                data, fingerprint = await self._get(endpoint, params, priority)
+            else:
+                data, fingerprint = await self.hedge_policy.run(lambda: self._get(endpoint, params, priority))
+        except NotFound as e:
+            self.add_not_found(key, str(e))
+            raise
+
+        if self.cache is not None:
+            self.cache.put(key, data, self.freshness_policy.next_refresh(endpoint, data), fingerprint)
+
+        return data, fingerprint
+
+
+    def check_not_found(self, key):
+        """
+        Raise NotFound if the request identified by `key` recently ended in NotFound.
+        """
+        if self.negative_cache is None:
+            return
+
+        message = self.negative_cache.get(key)
+
+        if message is not None:
+            raise NotFound(message)
+
+
+    def add_not_found(self, key, message):
+        """
+        Remember that the request identified by `key` ended in NotFound.
+        """
+        if self.negative_cache is not None:
+            self.negative_cache.add(key, message)
+
+
+    async def _get(self, endpoint, params=None, priority=NORMAL):
+        if self.mirrors is None:
+            return await self._get_from(endpoint, params, priority)
+
+        path = self.mirrors.path(endpoint)
+        error = None
+
+        for mirror in self.mirrors.ordered():
+            try:
+                return await self._get_from(mirror.url + path, params, priority, mirror)
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError, ServerError) as e:
+                self.mirrors.failure(mirror)
+                error = e
+
+        raise APIError('Every mirror failed: {}'.format(error))
+
+
+    async def _get_from(self, url, params=None, priority=NORMAL, mirror=None):
+        if self.scheduler is None:
+            return await self._timed_send(url, params, mirror)
+
+        async with self.scheduler.slot(priority):
+            return await self._timed_send(url, params, mirror)
+
+
+    async def _timed_send(self, url, params=None, mirror=None):
+        # only the request itself is timed, not the wait for a scheduler slot
+        start = time.monotonic()
+
+        try:
+            result = await self._send(url, params)
+        except NotFound:
+            if mirror is not None:
+                self.mirrors.success(mirror, time.monotonic() - start)
+            raise
+
+        if mirror is not None:
+            self.mirrors.success(mirror, time.monotonic() - start)
+
+        return result
+
+
+    async def _send(self, url, params=None):
+        async with self.session.get(url, params=params) as resp:
             if resp.status == 404:
                 raise NotFound('No data available for specified country, state or province.')
+            elif resp.status >= 500:
+                raise ServerError('An unexpected error occurred.')
             elif resp.status != 200:
                 raise APIError('An unexpected error occurred.')
 
-            return await resp.json()
+            body = await resp.read()
+
+        # only the model cache reads fingerprints, so large bodies are not hashed without one
+        fingerprint = hashlib.blake2b(body, digest_size=16).digest() if self.models is not None else None
+
+        return json.loads(body), fingerprint
+
+
+    async def stream(self, endpoint, params=None, priority=NORMAL, chunk_size=65536):
+        """
+        Yield the raw body of a response in chunks of bytes without reading it all into memory.
+        Mirrors are tried in turn until one responds, but a transfer that fails partway is not retried.
+        Responses are neither cached nor hedged.
+        """
+        if self.mirrors is None:
+            targets = [(None, endpoint)]
+        else:
+            path = self.mirrors.path(endpoint)
+            targets = [(mirror, mirror.url + path) for mirror in self.mirrors.ordered()]
+
+        error = None
+        started = False
+
+        for mirror, url in targets:
+            try:
+                async with contextlib.AsyncExitStack() as stack:
+                    if self.scheduler is not None:
+                        await stack.enter_async_context(self.scheduler.slot(priority))
+
+                    start = time.monotonic()
+                    resp = await stack.enter_async_context(self.session.get(url, params=params))
+
+                    if resp.status == 404:
+                        raise NotFound('No data available for specified country, state or province.')
+                    elif resp.status >= 500:
+                        raise ServerError('An unexpected error occurred.')
+                    elif resp.status != 200:
+                        raise APIError('An unexpected error occurred.')
+
+                    if mirror is not None:
+                        self.mirrors.success(mirror, time.monotonic() - start)
+
+                    started = True
+
+                    async for chunk in resp.content.iter_chunked(chunk_size):
+                        yield chunk
+
+                    return
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError, ServerError) as e:
+                if mirror is None or started:
+                    raise
+                self.mirrors.failure(mirror)
+                error = e
+
+        raise APIError('Every mirror failed: {}'.format(error))
+
+
+    def next_refresh(self, endpoint, params=None):
+        """
+        Get the UNIX timestamp at which a cached response will next be requested from the API,
+        or None if it is not cached.
+        """
+        if self.cache is None:
+            return None
+
+        return self.cache.expires(cache_key(endpoint, params))
 
 
     async def close(self):
-        await self.session.close()
\ No newline at end of file
+        await self.session.close()
@@ -0,0 +1,109 @@
+import difflib
+import unicodedata
+from bisect import bisect_left
+from .exceptions import NotFound
+
+COUNTRY_ALIASES = {
+    'united kingdom': 'uk',
+    'great britain': 'uk',
+    'britain': 'uk',
+    'england': 'uk',
+    'united states': 'usa',
+    'united states of america': 'usa',
+    'america': 'usa',
+    'us': 'usa',
+    'south korea': 's korea',
+    'korea': 's korea',
+    'republic of korea': 's korea',
+    'united arab emirates': 'uae',
+    'democratic republic of the congo': 'drc',
+    'czech republic': 'czechia',
+    'holland': 'netherlands',
+}
+
+
+def normalize(name):
+    """
+    Normalise a place name for matching; case, accents, punctuation and extra whitespace are ignored.
+    """
+    name = unicodedata.normalize('NFKD', str(name))
+    name = ''.join(c for c in name if not unicodedata.combining(c))
+    name = ''.join(c if c.isalnum() else ' ' for c in name.lower())
+    return ' '.join(name.split())
+
+
+class NameIndex:
+    """
+    Maps normalised names, codes and aliases of places to their canonical names.
+    """
+    def __init__(self, kind, aliases=None):
+        self.kind = kind
+        self.names = {}
+        self.aliases = dict(aliases or {})
+        self._keys = None
+
+    def add(self, canonical, *keys):
+        for key in (canonical,) + keys:
+            if key:
+                self.names.setdefault(normalize(key), canonical)
+        self._keys = None
+
+    def _sorted_keys(self):
+        if self._keys is None:
+            self._keys = sorted(self.names)
+        return self._keys
+
+    def resolve(self, query):
+        """
+        Get the canonical name for a query by exact, alias, prefix then fuzzy matching.
+        Raises NotFound if nothing matches.
+        """
+        key = normalize(query)
+        key = self.aliases.get(key, key)
+
+        if key in self.names:
+            return self.names[key]
+
+        keys = self._sorted_keys()
+        matches = set()
+        i = bisect_left(keys, key)
+        while i < len(keys) and keys[i].startswith(key):
+            matches.add(self.names[keys[i]])
+            i += 1
+
+        if len(matches) == 1:
+            return matches.pop()
+
+        close = difflib.get_close_matches(key, keys, n=1, cutoff=0.8)
+        if close:
+            return self.names[close[0]]
+
+        raise NotFound('No {} found matching {}.'.format(self.kind, query))
+
+
+class LocationResolver:
+    """
+    Resolves free-form country, state and continent names locally, before any request is made.
+    """
+    def __init__(self, countries, states):
+        self.countries = NameIndex('country', COUNTRY_ALIASES)
+        self.states = NameIndex('state')
+        self.continents = NameIndex('continent')
+
+        for country in countries:
+            info = country.info
+            self.countries.add(country.name, info.iso2, info.iso3, str(info.id) if info.id is not None else None)
+            if country.continent:
+                self.continents.add(country.continent)
+
+        for state in states:
+            self.states.add(state.name)
+
+    def country(self, name):
+        return self.countries.resolve(name)
+
+    def state(self, name):
+        return self.states.resolve(name)
+
+    def continent(self, name):
+        return self.continents.resolve(name)
@@ -0,0 +1,125 @@
+from .columnar import int_column, group_sum
+from .covidstatistics import Continent, Global, PerMillion, PerPeople, Today
+from .exceptions import NotFound
+
+_FIELDS = (
+    ('cases', lambda c: c.cases),
+    ('deaths', lambda c: c.deaths),
+    ('recoveries', lambda c: c.recoveries),
+    ('critical', lambda c: c.critical),
+    ('active', lambda c: c.active),
+    ('tests', lambda c: c.tests),
+    ('population', lambda c: c.population),
+    ('today_cases', lambda c: c.today.cases),
+    ('today_deaths', lambda c: c.today.deaths),
+    ('today_recoveries', lambda c: c.today.recoveries),
+)
+
+
+def _per_million(value, population):
+    return round(value / population * 1000000, 2) if population else 0
+
+
+def _per_people(value, population):
+    return round(population / value) if value else 0
+
+
+class Rollup:
+    """
+    Continent and global totals derived locally from one list of countries, e.g. the result of `all_countries()`,
+    so that they are always consistent with the country view and need no extra requests.
+    Every statistic is held as a typed column and summed per continent in a single pass.
+    """
+    def __init__(self, countries):
+        self.countries = countries
+        self.columns = {field: int_column(get(c) for c in countries) for field, get in _FIELDS}
+        self.updated = max((c.updated for c in countries), default=None)
+
+        groups = {}
+        for row, country in enumerate(countries):
+            if country.continent:
+                groups.setdefault(country.continent, []).append(row)
+        self.groups = groups
+
+        self._continent_totals = {field: group_sum(column, groups) for field, column in self.columns.items()}
+        self._global_totals = {field: sum(column) for field, column in self.columns.items()}
+
+    def _per_million(self, totals):
+        population = totals['population']
+
+        return PerMillion(
+            _per_million(totals['cases'], population),
+            _per_million(totals['deaths'], population),
+            _per_million(totals['tests'], population),
+            _per_million(totals['active'], population),
+            _per_million(totals['recoveries'], population),
+            _per_million(totals['critical'], population)
+        )
+
+    def _today(self, totals):
+        return Today(totals['today_cases'], totals['today_deaths'], totals['today_recoveries'])
+
+    @property
+    def continent_names(self):
+        return list(self.groups)
+
+    def continent(self, name) -> Continent:
+        """
+        The totals of one continent, matched case-insensitively. Raises NotFound if no country is in it.
+        """
+        for key in self.groups:
+            if key.lower() == name.lower():
+                break
+        else:
+            raise NotFound('No data for continent {}.'.format(name))
+
+        totals = {field: sums[key] for field, sums in self._continent_totals.items()}
+
+        return Continent(
+            key,
+            [self.countries[row].name for row in self.groups[key]],
+            totals['cases'],
+            totals['deaths'],
+            totals['recoveries'],
+            totals['critical'],
+            totals['active'],
+            totals['tests'],
+            self._today(totals),
+            self._per_million(totals),
+            totals['population'],
+            max(self.countries[row].updated for row in self.groups[key])
+        )
+
+    def continents(self):
+        """
+        The totals of every continent, in the order they first appear in the country list.
+        """
+        return [self.continent(name) for name in self.groups]
+
+    def world(self) -> Global:
+        """
+        The global totals over every country.
+        """
+        totals = self._global_totals
+        population = totals['population']
+
+        per_people = PerPeople(
+            _per_people(totals['cases'], population),
+            _per_people(totals['deaths'], population),
+            _per_people(totals['tests'], population)
+        )
+
+        return Global(
+            totals['cases'],
+            totals['deaths'],
+            totals['recoveries'],
+            self._today(totals),
+            totals['critical'],
+            totals['active'],
+            totals['tests'],
+            self._per_million(totals),
+            per_people,
+            population,
+            len(self.countries),
+            self.updated
+        )
@@ -0,0 +1,112 @@
+import asyncio
+import time
+from collections import deque
+
+INTERACTIVE = 0
+NORMAL = 1
+BACKGROUND = 2
+
+
+class PriorityScheduler:
+    """
+    Limits the number of requests in flight and hands free slots to the highest priority waiting request.
+
+    Priorities are INTERACTIVE, NORMAL and BACKGROUND. So that lower priorities are not starved,
+    a request which has waited longer than `starvation_timeout` seconds is dispatched first.
+    """
+    def __init__(self, max_concurrency, starvation_timeout=5.0):
+        self.max_concurrency = max_concurrency
+        self.starvation_timeout = starvation_timeout
+        self.active = 0
+        self._queues = {priority: deque() for priority in (INTERACTIVE, NORMAL, BACKGROUND)}
+
+    @property
+    def waiting(self):
+        return sum(len(queue) for queue in self._queues.values())
+
+    async def acquire(self, priority=NORMAL):
+        if priority not in self._queues:
+            raise ValueError('Unknown priority: {}.'.format(priority))
+
+        if self.active < self.max_concurrency and not self.waiting:
+            self.active += 1
+            return
+
+        waiter = asyncio.get_event_loop().create_future()
+        entry = (time.monotonic(), waiter)
+        self._queues[priority].append(entry)
+
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                self.release() #the slot was handed over just before the cancellation
+            else:
+                self._queues[priority].remove(entry)
+            raise
+
+    def release(self):
+        waiter = self._next()
+
+        if waiter is None:
+            self.active -= 1
+        else:
+            waiter.set_result(None) #the slot passes straight to the waiter
+
+    def _next(self):
+        now = time.monotonic()
+        starving = None
+
+        for queue in self._queues.values():
+            while queue and queue[0][1].done():
+                queue.popleft()
+
+            if queue and now - queue[0][0] >= self.starvation_timeout:
+                if starving is None or queue[0][0] < starving[0][0]:
+                    starving = queue
+
+        if starving is not None:
+            return starving.popleft()[1]
+
+        for priority in sorted(self._queues):
+            queue = self._queues[priority]
+            if queue:
+                return queue.popleft()[1]
+
+        return None
+
+    def slot(self, priority=NORMAL):
+        return _Slot(self, priority)
+
+
+class _Slot:
+    def __init__(self, scheduler, priority):
+        self.scheduler = scheduler
+        self.priority = priority
+
+    async def __aenter__(self):
+        await self.scheduler.acquire(self.priority)
+
+    async def __aexit__(self, *exc):
+        self.scheduler.release()
+
+
+class PriorityView:
+    """
+    A view of a RequestClient which makes every request with the given priority.
+    """
+    def __init__(self, request_client, priority):
+        self._request_client = request_client
+        self.priority = priority
+
+    async def make_request(self, endpoint, params=None, priority=None):
+        return await self._request_client.make_request(endpoint, params, self.priority if priority is None else priority)
+
+    async def fetch(self, endpoint, params=None, priority=None):
+        return await self._request_client.fetch(endpoint, params, self.priority if priority is None else priority)
+
+    def stream(self, endpoint, params=None, priority=None, chunk_size=65536):
+        return self._request_client.stream(endpoint, params, self.priority if priority is None else priority, chunk_size)
+
+    def __getattr__(self, name):
+        return getattr(self._request_client, name)
@@ -0,0 +1,183 @@
+from math import asin, cos, degrees, floor, pi, radians, sin, sqrt
+from .covidstatistics import Country, JhuCsse
+
+EARTH_RADIUS = 6371.0088 #km
+
+
+def distance(lat1, lon1, lat2, lon2):
+    """
+    Great-circle distance in km between two points given in degrees.
+    """
+    lat1, lon1, lat2, lon2 = radians(lat1), radians(lon1), radians(lat2), radians(lon2)
+    h = sin((lat2 - lat1) / 2) ** 2 + cos(lat1) * cos(lat2) * sin((lon2 - lon1) / 2) ** 2
+    return 2 * EARTH_RADIUS * asin(min(1.0, sqrt(h)))
+
+
+def _key(item):
+    if isinstance(item, JhuCsse):
+        return (item.country_name, item.province_name, item.county_name)
+    if isinstance(item, Country):
+        return item.name
+    return id(item)
+
+
+def _point(item):
+    if isinstance(item, Country):
+        item = item.info
+    return item.latitude, item.longitude
+
+
+def _coordinate(value):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+class SpatialIndex:
+    """
+    A grid of `cell` degree squares over the coordinates of `JhuCsse`, `Country` or `CountryInfo` objects,
+    answering nearest, radius and bounding box queries without scanning every place.
+
+    Items without usable coordinates are skipped. Call `update()` with a newer snapshot to re-bucket
+    only the places which were added, moved or removed.
+    """
+    def __init__(self, items=(), cell=1.0, key=_key, point=_point):
+        if not 0 < cell <= 180:
+            raise ValueError('cell should be between 0 and 180 degrees.')
+
+        self.cell = cell
+        self.key = key
+        self.point = point
+        self._rows = int(180 // cell) + 1
+        self._columns = int(round(360 / cell))
+        self._cells = {}
+        self._entries = {}
+        self.update(items)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _cell(self, lat, lon):
+        row = min(int(floor((lat + 90) / self.cell)), self._rows - 1)
+        column = int(floor((lon + 180) / self.cell)) % self._columns
+        return row, column
+
+    def _insert(self, key, lat, lon, item):
+        cell = self._cell(lat, lon)
+        self._entries[key] = (lat, lon, cell, item)
+        self._cells.setdefault(cell, {})[key] = item
+
+    def _remove(self, key):
+        lat, lon, cell, item = self._entries.pop(key)
+        bucket = self._cells[cell]
+        del bucket[key]
+        if not bucket:
+            del self._cells[cell]
+
+    def update(self, items):
+        """
+        Bring the index in line with a new snapshot. Places whose coordinates are unchanged keep their cell
+        and only have their object swapped for the newer one.
+        Returns the number of places added, moved or removed.
+        """
+        seen = set()
+        changed = 0
+
+        for item in items:
+            lat, lon = (_coordinate(v) for v in self.point(item))
+            if lat is None or lon is None or not -90 <= lat <= 90:
+                continue
+
+            key = self.key(item)
+            seen.add(key)
+            entry = self._entries.get(key)
+
+            if entry is not None and entry[0] == lat and entry[1] == lon:
+                self._entries[key] = (lat, lon, entry[2], item)
+                self._cells[entry[2]][key] = item
+                continue
+
+            if entry is not None:
+                self._remove(key)
+            self._insert(key, lat, lon, item)
+            changed += 1
+
+        for key in [k for k in self._entries if k not in seen]:
+            self._remove(key)
+            changed += 1
+
+        return changed
+
+    def _scan(self, south, north, west, east):
+        first_row, first_column = self._cell(max(south, -90), west)
+        last_row = self._cell(min(north, 90), east)[0]
+        count = int(floor((east + 180) / self.cell)) - int(floor((west + 180) / self.cell)) + 1
+
+        if count >= self._columns:
+            columns = range(self._columns)
+        else:
+            columns = [(first_column + i) % self._columns for i in range(count)]
+
+        for row in range(first_row, last_row + 1):
+            for column in columns:
+                bucket = self._cells.get((row, column))
+                if bucket:
+                    for key in bucket:
+                        yield self._entries[key]
+
+    def within_radius(self, lat, lon, radius):
+        """
+        Every place within `radius` km of a point, as (item, distance) pairs sorted by distance.
+        """
+        angle = radius / EARTH_RADIUS
+        span = degrees(angle)
+        south, north = lat - span, lat + span
+
+        if south <= -90 or north >= 90 or angle >= pi / 2:
+            west, east = -180, 180
+        else:
+            width = degrees(asin(min(1.0, sin(angle) / cos(radians(lat)))))
+            west, east = lon - width, lon + width
+
+        found = []
+        for plat, plon, cell, item in self._scan(south, north, west, east):
+            d = distance(lat, lon, plat, plon)
+            if d <= radius:
+                found.append((item, d))
+
+        found.sort(key=lambda pair: pair[1])
+        return found
+
+    def nearest(self, lat, lon, k=1):
+        """
+        The `k` places closest to a point, as (item, distance) pairs sorted by distance.
+        """
+        if k < 1 or not self._entries:
+            return []
+
+        radius = self.cell * 111.0
+        limit = EARTH_RADIUS * pi
+
+        while True:
+            found = self.within_radius(lat, lon, radius)
+            if len(found) >= k or radius >= limit:
+                return found[:k]
+            radius *= 2
+
+    def within_bbox(self, south, west, north, east):
+        """
+        Every place inside a bounding box given in degrees. If `west` is greater than `east`
+        the box crosses the antimeridian.
+        """
+        if west > east:
+            east += 360
+
+        found = []
+        for plat, plon, cell, item in self._scan(south, north, west, east):
+            if not south <= plat <= north:
+                continue
+            if west <= plon <= east or west <= plon + 360 <= east:
+                found.append(item)
+
+        return found
@@ -0,0 +1,116 @@
+import sqlite3
+from datetime import datetime
+from .covidstatistics import Historical, History, HistoryEntry
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS history (
+    series TEXT NOT NULL,
+    date TEXT NOT NULL,
+    cases INTEGER,
+    deaths INTEGER,
+    recovered INTEGER,
+    PRIMARY KEY (series, date)
+);
+CREATE TABLE IF NOT EXISTS synced (
+    series TEXT PRIMARY KEY,
+    name TEXT,
+    last_date TEXT NOT NULL
+);
+"""
+
+
+class HistoryStore:
+    """
+    Local SQLite store of historical timelines which is kept up to date incrementally.
+
+    Each sync only requests the days since the last synced date, plus `overlap` days
+    so that upstream revisions of recent figures are picked up, and patches them in place.
+    """
+    def __init__(self, path=':memory:', overlap=3):
+        self.overlap = overlap
+        self.connection = sqlite3.connect(path)
+        self.connection.executescript(_SCHEMA)
+
+    def last_synced(self, country='all'):
+        """
+        Get the most recent date stored for a country, or None if it has never been synced.
+        """
+        row = self.connection.execute(
+            'SELECT last_date FROM synced WHERE series = ?', (self._series(country),)
+        ).fetchone()
+
+        return datetime.strptime(row[0], '%Y-%m-%d') if row else None
+
+    async def sync(self, covid, country='all'):
+        """
+        Bring the stored timeline of a country (or 'all' for global data) up to date.
+        Returns the number of days written.
+        """
+        last = self.last_synced(country)
+
+        if last is None:
+            last_days = 'all'
+        else:
+            last_days = max((datetime.utcnow() - last).days, 0) + self.overlap
+
+        historical = await covid.country_history(country, last_days)
+        history = historical.history
+        recoveries = history.recoveries or []
+        recovered = {entry.date: entry.value for entry in recoveries}
+        deaths = {entry.date: entry.value for entry in history.deaths}
+        series = self._series(country)
+
+        rows = [
+            (series, entry.date.strftime('%Y-%m-%d'), entry.value, deaths.get(entry.date), recovered.get(entry.date))
+            for entry in history.cases
+        ]
+
+        if not rows:
+            return 0
+
+        newest = max(row[1] for row in rows)
+
+        with self.connection:
+            self.connection.executemany('INSERT OR REPLACE INTO history VALUES (?, ?, ?, ?, ?)', rows)
+            self.connection.execute(
+                'INSERT OR REPLACE INTO synced VALUES (?, ?, MAX(?, COALESCE((SELECT last_date FROM synced WHERE series = ?), \'\')))',
+                (series, historical.name, newest, series)
+            )
+
+        return len(rows)
+
+    def history(self, country='all', start=None, end=None) -> Historical:
+        """
+        Get a stored timeline, optionally limited to the dates between `start` and `end` inclusive.
+        """
+        series = self._series(country)
+        query = 'SELECT date, cases, deaths, recovered FROM history WHERE series = ?'
+        args = [series]
+
+        if start is not None:
+            query += ' AND date >= ?'
+            args.append(start.strftime('%Y-%m-%d'))
+
+        if end is not None:
+            query += ' AND date <= ?'
+            args.append(end.strftime('%Y-%m-%d'))
+
+        cases = []
+        deaths = []
+        recoveries = []
+
+        for date, case_count, death_count, recovered in self.connection.execute(query + ' ORDER BY date', args):
+            date = datetime.strptime(date, '%Y-%m-%d')
+            cases.append(HistoryEntry(date, case_count))
+            deaths.append(HistoryEntry(date, death_count))
+            recoveries.append(HistoryEntry(date, recovered))
+
+        row = self.connection.execute('SELECT name FROM synced WHERE series = ?', (series,)).fetchone()
+
+        return Historical(row[0] if row else country, None, History(cases, deaths, recoveries))
+
+    def close(self):
+        self.connection.close()
+
+    def _series(self, country):
+        return str(country).lower()
@@ -0,0 +1,156 @@
+import asyncio
+
+
+def signature(value):
+    """
+    Summarise a result so that two polls can be compared.
+    Objects with an `updated` stamp are summarised by it, anything else by its contents.
+    """
+    if isinstance(value, (list, tuple)):
+        return tuple(signature(v) for v in value)
+
+    if isinstance(value, dict):
+        return tuple(sorted((k, signature(v)) for k, v in value.items()))
+
+    updated = getattr(value, 'updated', None)
+    if updated is not None:
+        return (type(value).__name__, updated)
+
+    if hasattr(value, '__dict__'):
+        return (type(value).__name__, signature(vars(value)))
+
+    return value
+
+
+class _Poller:
+    def __init__(self, hub, key, method, args, kwargs):
+        self.hub = hub
+        self.key = key
+        self.method = method
+        self.args = args
+        self.kwargs = kwargs
+        self.subscriptions = set()
+        self.latest = None
+        self.has_value = False
+        self.state = None
+        self.last_error = None
+        self.task = None
+
+    @property
+    def interval(self):
+        return min(s.interval for s in self.subscriptions)
+
+    def subscribe(self, subscription):
+        self.subscriptions.add(subscription)
+
+        if self.has_value:
+            subscription._push(self.latest)
+
+        if self.task is None:
+            self.task = asyncio.ensure_future(self._run())
+
+    def unsubscribe(self, subscription):
+        self.subscriptions.discard(subscription)
+
+        if not self.subscriptions:
+            if self.task is not None:
+                self.task.cancel()
+            self.hub._pollers.pop(self.key, None)
+
+    async def _run(self):
+        while self.subscriptions:
+            try:
+                value = await self.method(*self.args, **self.kwargs)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.last_error = e
+            else:
+                self.last_error = None
+                state = signature(value)
+
+                if not self.has_value or state != self.state:
+                    self.latest = value
+                    self.has_value = True
+                    self.state = state
+                    for subscription in list(self.subscriptions):
+                        subscription._push(value)
+
+            await asyncio.sleep(self.interval)
+
+
+_CLOSED = object()
+
+
+class Subscription:
+    """
+    Asynchronous iterator over the changes of a watched resource.
+    Use it with `async with` or call `close()` so that polling stops once nobody is watching.
+    """
+    def __init__(self, poller, interval):
+        self.interval = interval
+        self._poller = poller
+        self._queue = asyncio.Queue(maxsize=1)
+        self._closed = False
+        poller.subscribe(self)
+
+    def _push(self, value):
+        # slow consumers only ever see the most recent value
+        if self._queue.full():
+            self._queue.get_nowait()
+        self._queue.put_nowait(value)
+
+    @property
+    def last_error(self):
+        """
+        The error raised by the most recent poll, or None if it succeeded.
+        """
+        return self._poller.last_error
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if self._closed:
+            raise StopAsyncIteration
+
+        value = await self._queue.get()
+        if value is _CLOSED:
+            raise StopAsyncIteration
+        return value
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        self.close()
+
+    def close(self):
+        if not self._closed:
+            self._closed = True
+            self._poller.unsubscribe(self)
+            self._push(_CLOSED) #wake a consumer waiting in another task
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
+
+
+class WatchHub:
+    """
+    Shares one poller between every subscription to the same method and arguments.
+    """
+    def __init__(self):
+        self._pollers = {}
+
+    def watch(self, method, *args, **kwargs):
+        interval = kwargs.pop('interval', 60)
+        key = (method, args, tuple(sorted(kwargs.items())))
+        poller = self._pollers.get(key)
+
+        if poller is None:
+            poller = self._pollers[key] = _Poller(self, key, method, args, kwargs)
+
+        return Subscription(poller, interval)
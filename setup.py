@@ -17,6 +17,7 @@ setup(
   author_email = 'apex@taka.moe',
   url = 'https://github.com/apex2504/disease.py',
   keywords = ['coronavirus', 'covid-19'],
+  python_requires='>=3.8',
   install_requires=[
           'aiohttp',
       ],
@@ -24,9 +25,9 @@ setup(
     'Development Status :: 5 - Production/Stable',
     'License :: OSI Approved :: MIT License',
     'Programming Language :: Python :: 3',
-    'Programming Language :: Python :: 3.5',
-    'Programming Language :: Python :: 3.6',
-    'Programming Language :: Python :: 3.7',
     'Programming Language :: Python :: 3.8',
+    'Programming Language :: Python :: 3.9',
+    'Programming Language :: Python :: 3.10',
+    'Programming Language :: Python :: 3.11',
   ],
 )